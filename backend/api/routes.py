@@ -79,7 +79,7 @@ async def create_game_endpoint(
         )
         
         # Save game configuration to database
-        save_game_to_database(game_model)
+        save_game_to_database(game_model, new=True)
 
         # Trigger the game worker to initialize and run the game asynchronously
         # Worker will fetch all configuration from database
@@ -23,10 +23,17 @@ class GameConfig:
     num_negotiation_rounds: int = 2 #Number of negotiation rounds before final action
     max_ai_retries: int = 0
     ai_timeout: int = 30  # seconds
+    max_concurrency: int = 16  # Max AI calls in flight at once (e.g. tile generation), keeps under provider RPM
+    tile_batch_size: int = 16  # Tiles requested per AI call; 1 generates each tile with its own call (always the case with world_seed)
+    batch_player_prompts: bool = False  # One AI call per negotiation/action round for players sharing a model
+    world_seed: int | None = None  # Set to seed tile generation per position, so a world regenerates (best effort) the same tiles
+    tile_version: int = 1  # Bump when tiles change shape or prompt, so the tile cache stops serving old ones
+    full_snapshot_interval: int = 10  # Turns between full state saves; turns in between store only changed tiles (1 = always full)
     
     # File paths
     save_dir: str = "saves"
     data_dir: str = "data"
+    tile_cache_file: str = "data/tile_cache.sqlite3"  # Generated tiles of seeded worlds (see world_seed)
     
     def __post_init__(self):
         """Ensure directories exist"""
@@ -69,6 +76,10 @@ class AIConfig:
         "Ensure that all tiles are interesting and provide opportunities even if value is low. "
         "Keep tone immersive and neutral-fantasy. Avoid repetition between nearby tiles.\n"
     )
+    tile_batch_prompt: str = tile_prompt + (
+        "\nYou will be given a numbered list of coordinates. Return exactly one tile per coordinate, "
+        "in the same order, and set each tile's position to its coordinate. Follow the rules above for every tile.\n"
+    )
     tile_update_prompt: str = (
         "You are the Dungeon Master. Update the tile’s one-sentence description "
         "to reflect a recent event. Keep tone immersive and concise. "
@@ -1,14 +1,22 @@
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import json
+try:
+    import orjson
+except ImportError:  # Optional dependency; the stdlib json module is used without it
+    orjson = None
 class Savable:
+    __slots__ = ()  # Lets subclasses that declare __slots__ drop their per-instance __dict__
     @abstractmethod
     def save(self) -> str:
         raise Exception(f"Save not implemented for {self}")
     def load(self, loaded_data:dict|str):
         raise Exception(f"Load not implemented for {self}")
+    def to_dict(self) -> dict:
+        """Plain-dict form of save(); override to skip the JSON round trip"""
+        return Savable.fromJSON(self.save())
     @staticmethod
-    def toJSON(data: dict) -> str:
+    def toJSON(data: dict | list) -> str:
         return FileManager.toJSON(data)
     @staticmethod
     def fromJSON(data: str) -> dict:
@@ -51,8 +59,18 @@ class FileManager:
         data = Savable.fromJSON(json_str)
         obj.load(data)
     @staticmethod
-    def toJSON(data: dict) -> str:
+    def toJSON(data: dict | list) -> str:
+        if orjson is not None:
+            try:
+                return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                pass  # e.g. integers past 64 bits, which the stdlib encoder still handles
         return json.dumps(data) #Ensures consistent saving / loading parameters
     @staticmethod
     def fromJSON(data: str) -> dict:
+        if orjson is not None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # stdlib json also accepts NaN/Infinity from older saves, and raises the usual error otherwise
         return json.loads(data)
\ No newline at end of file
@@ -0,0 +1,47 @@
+import sqlite3
+import threading
+from database.fileManager import FileManager
+
+class TileCache:
+    """
+    On-disk cache of generated tiles keyed by (world seed, x, y, tile version), so seeded
+    worlds reuse tiles across games and reloads instead of asking the AI again.
+    Bump GameConfig.tile_version when the tile format or prompts change to ignore old rows.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        # Tiles are generated on worker threads, so the connection is shared behind the lock
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS tiles ("
+                "seed INTEGER NOT NULL, x INTEGER NOT NULL, y INTEGER NOT NULL, "
+                "version INTEGER NOT NULL, payload BLOB NOT NULL, "
+                "PRIMARY KEY (seed, x, y, version))"
+            )
+
+    def get_many(self, seed: int, version: int, positions: list[tuple[int, int]]) -> dict[tuple[int, int], dict]:
+        """Cached tile data for whichever of the positions are stored"""
+        found = {}
+        with self._lock:
+            for x, y in positions:
+                row = self._conn.execute(
+                    "SELECT payload FROM tiles WHERE seed = ? AND x = ? AND y = ? AND version = ?",
+                    (seed, x, y, version),
+                ).fetchone()
+                if row is not None:
+                    found[(x, y)] = FileManager.fromJSON(row[0])
+        return found
+
+    def put_many(self, seed: int, version: int, tiles: dict[tuple[int, int], str]) -> None:
+        """Store serialized tiles; the first tile generated for a key wins"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO tiles (seed, x, y, version, payload) VALUES (?, ?, ?, ?, ?)",
+                [(seed, x, y, version, payload) for (x, y), payload in tiles.items()],
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -3,7 +3,8 @@ DnD-style character progression system with race, class, skills, and leveling
 """
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Dict, List, Optional, ClassVar
+from typing import Collection, Dict, List, Optional, ClassVar
+from functools import lru_cache
 import json
 import os
 
@@ -71,7 +72,7 @@ class CharacterTemplate(BaseModel):
     resource_pools: Dict[str, int]
     hit_die: str
 
-    def get_available_skills(self, level: int, current_abilities: List[str],
+    def get_available_skills(self, level: int, current_abilities: Collection[str],
                             attributes: CharacterAttributes) -> List[SkillData]:
         """Get skills that can be unlocked at current level"""
         available = []
@@ -191,7 +192,12 @@ def get_character_template_path(class_name: str) -> str:
     return os.path.join(base_dir, 'data', 'character_templates', f'{class_name.lower()}.json')
 
 
+@lru_cache(maxsize=64)
 def load_character_template(class_name: str) -> CharacterTemplate:
-    """Load character template by class name"""
+    """
+    Load character template by class name.
+    Templates are static files, so each is parsed once per process and the
+    instance is shared by every caller; treat it as read-only.
+    """
     filepath = get_character_template_path(class_name)
     return CharacterTemplate.load_from_file(filepath)
@@ -3,6 +3,7 @@ Game-specific data models
 """
 
 from pydantic import BaseModel, Field
+from schema.rowModel import RowModel
 from typing import Dict, List, Optional
 from api.apiDtoModel import GameResponse, CharacterState, WorldState, TileState
 from schema.enums import GameStatus
@@ -20,6 +21,8 @@ class GameStateModel(BaseModel):
     # Game ending state
     is_game_over: bool = Field(default=False)
     game_over_reason: Optional[str] = Field(default=None)
+    # Set on delta turns: tiles then only hold tiles changed since that full snapshot turn
+    snapshot_turn_id: Optional[int] = Field(default=None)
 
 class PlayerConfigModel(BaseModel):
     """Individual player configuration"""
@@ -29,7 +32,7 @@ class PlayerConfigModel(BaseModel):
     character_class: Optional[str] = None
     agent_prompt: Optional[str] = ""
 
-class GameModel(BaseModel):
+class GameModel(RowModel):
     id: str = Field(min_length=1)
     name: str = Field(default="Untitled Game")
     description: str = Field(default="")
@@ -3,6 +3,7 @@ Player-specific data models
 """
 
 from pydantic import BaseModel, Field
+from schema.rowModel import RowModel
 from typing import List, Dict, Optional
 
 class PlayerValuesModel(BaseModel):
@@ -10,13 +11,15 @@ class PlayerValuesModel(BaseModel):
     health: int = Field(ge=0, default=100)
     inventory: List[str] = Field(default_factory=list)
 
-class PlayerModel(BaseModel):
+class PlayerModel(RowModel):
     uid: str = Field(min_length=1)
     position: List[int] = Field(min_length=2, max_length=2)
     model: str = Field(default="gpt-4.1-mini")
     player_class: str = Field(default="human")
     values: PlayerValuesModel = Field(default_factory=PlayerValuesModel)
     responses: List[str] = Field(default_factory=list)
+    # Responses ever recorded; responses only keeps the most recent ones
+    response_count: int = Field(ge=0, default=0)
     character_template_name: Optional[str] = Field(default=None)
     current_abilities: List[str] = Field(default_factory=list)
     resource_pools: Dict[str, int] = Field(default_factory=dict)
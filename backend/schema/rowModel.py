@@ -0,0 +1,37 @@
+"""
+Base model for entities persisted as database rows
+"""
+
+from typing import Optional
+from pydantic import BaseModel, PrivateAttr
+
+
+class RowModel(BaseModel):
+    """
+    Caches the JSON-mode row dump so save() followed by update() on an
+    unchanged model only walks it once.
+
+    Assigning any field drops the cache. In-place changes to nested values
+    (e.g. player.values.money += 1) are not seen, so call invalidate_row()
+    after those.
+    """
+    _row_cache: Optional[dict] = PrivateAttr(default=None)
+
+    def __setattr__(self, name, value):
+        if name in type(self).model_fields:
+            self.invalidate_row()
+        super().__setattr__(name, value)
+
+    def to_row(self) -> dict:
+        """model_dump(mode="json", exclude_none=True), reused until a field changes; treat as read-only"""
+        if self._row_cache is None:
+            self._row_cache = self.model_dump(mode="json", exclude_none=True)
+        return self._row_cache
+
+    def invalidate_row(self) -> None:
+        self._row_cache = None
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        copied.invalidate_row()
+        return copied
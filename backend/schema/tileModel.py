@@ -3,13 +3,14 @@ Tile-specific data models
 """
 
 from pydantic import BaseModel, Field, model_validator
+from schema.rowModel import RowModel
 from typing import List, Dict, Any, Optional
 
 class SecretKV(BaseModel):
     key: str
     value: int
 
-class TileModel(BaseModel):
+class TileModel(RowModel):
     position: List[int] = Field(min_length=2, max_length=2)
     description: str = Field(default="")
     terrainType: str = Field(default="plains")
@@ -40,3 +41,8 @@ class TileModel(BaseModel):
                         transformed_secrets.append(secret)
                 data['secrets'] = transformed_secrets
         return data
+
+
+class TileBatchModel(BaseModel):
+    """Structured output for generating several tiles in one request"""
+    tiles: List[TileModel] = Field(default_factory=list)
@@ -3,11 +3,12 @@ Turn data model for storing game state at each turn
 """
 
 from pydantic import BaseModel, Field
+from schema.rowModel import RowModel
 from typing import Optional, Dict, List
 from schema.gameModel import GameStateModel
 
 
-class TurnModel(BaseModel):
+class TurnModel(RowModel):
     id: Optional[int] = Field(default=None)
     game_id: str = Field(min_length=1)
     turn_number: int = Field(ge=0)
@@ -6,13 +6,14 @@ from typing import List
 from schema.gameModel import GameModel
 from services.storage import get_storage_factory
 
-def save_game_to_database(game_model: GameModel) -> str:
+def save_game_to_database(game_model: GameModel, new: bool = False) -> str:
     """
     Save game data to database/file system
+    Pass new=True when the game is being created, to insert instead of upsert
     Returns the saved game ID
     """
     storage = get_storage_factory().create_game_storage()
-    return storage.save(game_model)
+    return storage.save(game_model, new=new)
 
 def load_game_from_database(game_id: str) -> GameModel:
     """
@@ -102,6 +103,6 @@ def create_game(
         total_players=getattr(game, 'total_players', None),
         game_duration=None
     )
-    save_game_to_database(game_data)
+    save_game_to_database(game_data, new=True)
     
     return id
\ No newline at end of file
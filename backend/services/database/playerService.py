@@ -6,13 +6,14 @@ from typing import List
 from schema.playerModel import PlayerModel
 from services.storage import get_storage_factory
 
-def save_player_to_database(player_model: PlayerModel) -> str:
+def save_player_to_database(player_model: PlayerModel, new: bool = False) -> str:
     """
     Save player data to database/file system
+    Pass new=True when the player is being created, to insert instead of upsert
     Returns the saved player ID
     """
     storage = get_storage_factory().create_player_storage()
-    return storage.save(player_model)
+    return storage.save(player_model, new=new)
 
 def load_player_from_database(player_id: str) -> PlayerModel:
     """
@@ -2,7 +2,7 @@
 Turn service for database operations
 """
 
-from typing import List
+from typing import List, Optional
 from schema.turnModel import TurnModel
 from services.storage import get_storage_factory
 
@@ -22,16 +22,16 @@ def load_turn_from_database(turn_id: int) -> TurnModel:
     Returns the loaded turn data as TurnModel
     """
     storage = get_storage_factory().create_turn_storage()
-    return storage.load(turn_id)
+    return _expand_deltas([storage.load(turn_id)])[0]
 
 
-def get_turns_by_game_id(game_id: str) -> List[TurnModel]:
+def get_turns_by_game_id(game_id: str, limit: Optional[int] = None) -> List[TurnModel]:
     """
-    Get all turns for a specific game from database
+    Get turns for a specific game from database, or only the last `limit` of them
     Returns list of TurnModel instances ordered by turn_number
     """
     storage = get_storage_factory().create_turn_storage()
-    return storage.get_by_game_id(game_id)
+    return _expand_deltas(storage.get_by_game_id(game_id, limit=limit))
 
 
 def get_latest_turn_by_game_id(game_id: str) -> TurnModel:
@@ -40,7 +40,35 @@ def get_latest_turn_by_game_id(game_id: str) -> TurnModel:
     Returns the latest TurnModel instance
     """
     storage = get_storage_factory().create_turn_storage()
-    return storage.get_latest_by_game_id(game_id)
+    return _expand_deltas([storage.get_latest_by_game_id(game_id)])[0]
+
+
+def _expand_deltas(turns: List[TurnModel]) -> List[TurnModel]:
+    """
+    Rebuild the full game state of delta turns (game_state.snapshot_turn_id set):
+    the snapshot turn's tiles with the delta's changed tiles laid over them
+    """
+    snapshots = {turn.id: turn for turn in turns if turn.game_state.snapshot_turn_id is None}
+    expanded = []
+    for turn in turns:
+        snapshot_id = turn.game_state.snapshot_turn_id
+        if snapshot_id is None:
+            expanded.append(turn)
+            continue
+        snapshot = snapshots.get(snapshot_id)
+        if snapshot is None:
+            try:
+                snapshot = get_storage_factory().create_turn_storage().load(snapshot_id)
+            except ValueError as e:
+                print(f"Warning: Snapshot turn {snapshot_id} for turn {turn.id} unavailable, returning delta only: {e}")
+                expanded.append(turn)
+                continue
+            snapshots[snapshot_id] = snapshot
+        tiles = {tuple(tile.position): tile for tile in snapshot.game_state.tiles}
+        tiles.update((tuple(tile.position), tile) for tile in turn.game_state.tiles)
+        game_state = turn.game_state.model_copy(update={"tiles": list(tiles.values()), "snapshot_turn_id": None})
+        expanded.append(turn.model_copy(update={"game_state": game_state}))
+    return expanded
 
 
 def delete_turn_from_database(turn_id: int) -> bool:
@@ -72,6 +72,9 @@ class GameWorker:
                     player_configs=player_configs,
                 )
                 
+                # Generate the tiles players start next to before the first turn asks for them
+                self.game.prewarm_tiles()
+                
                 # Transition from PENDING to ACTIVE
                 self.game.status = GameStatus.ACTIVE
                 self._log(f"Game initialized successfully with {len(self.game.players)} players")
@@ -9,6 +9,7 @@ This module provides:
 """
 
 from services.storage.storage_adapter import (
+    StorageError,
     GameStorageAdapter,
     PlayerStorageAdapter,
     TileStorageAdapter
@@ -32,6 +33,7 @@ from services.storage.storage_factory import (
 
 __all__ = [
     # Interfaces
+    "StorageError",
     "GameStorageAdapter",
     "PlayerStorageAdapter",
     "TileStorageAdapter",
@@ -3,16 +3,17 @@ File-based storage adapter implementations.
 Uses JSON files for persistence.
 """
 
-from typing import List
+from typing import Dict, List
 import json
 import os
 import glob
 from schema.gameModel import GameModel
 from schema.playerModel import PlayerModel
 from schema.tileModel import TileModel
+from services.storage.storage_adapter import AsyncLoadMixin, tile_id_for
 
 
-class FileGameStorageAdapter:
+class FileGameStorageAdapter(AsyncLoadMixin):
     """File-based storage adapter for Game entities"""
     
     def __init__(self, data_dir: str = None):
@@ -31,13 +32,17 @@ class FileGameStorageAdapter:
         self.data_dir = data_dir
         os.makedirs(self.data_dir, exist_ok=True)
     
-    def save(self, game: GameModel) -> str:
-        """Save a game to file system"""
+    def save(self, game: GameModel, *, new: bool = False) -> str:
+        """Save a game to file system (new is accepted for interface parity; files are always overwritten)"""
         file_path = os.path.join(self.data_dir, f"game_save_{game.id}.json")
         with open(file_path, "w") as f:
             json.dump(game.model_dump(), f, indent=2)
         return game.id
     
+    def save_many(self, games: List[GameModel]) -> List[str]:
+        """Save many games to file system"""
+        return [self.save(game) for game in games]
+    
     def load(self, game_id: str) -> GameModel:
         """Load a game from file system"""
         try:
@@ -50,6 +55,16 @@ class FileGameStorageAdapter:
         except Exception as e:
             raise ValueError(f"Error loading game {game_id}: {str(e)}")
     
+    def load_many(self, game_ids: List[str]) -> Dict[str, GameModel]:
+        """Load the games that exist among game_ids, keyed by ID"""
+        games = {}
+        for game_id in game_ids:
+            try:
+                games[game_id] = self.load(game_id)
+            except ValueError:
+                continue
+        return games
+    
     def get_all(self) -> List[GameModel]:
         """Get all games from file system"""
         games = []
@@ -89,7 +104,7 @@ class FileGameStorageAdapter:
             return False
 
 
-class FilePlayerStorageAdapter:
+class FilePlayerStorageAdapter(AsyncLoadMixin):
     """File-based storage adapter for Player entities"""
     
     def __init__(self, data_dir: str = None):
@@ -108,13 +123,17 @@ class FilePlayerStorageAdapter:
         self.data_dir = data_dir
         os.makedirs(self.data_dir, exist_ok=True)
     
-    def save(self, player: PlayerModel) -> str:
-        """Save a player to file system"""
+    def save(self, player: PlayerModel, *, new: bool = False) -> str:
+        """Save a player to file system (new is accepted for interface parity; files are always overwritten)"""
         file_path = os.path.join(self.data_dir, f"player_save_{player.uid}.json")
         with open(file_path, "w") as f:
             json.dump(player.model_dump(), f, indent=2)
         return player.uid
     
+    def save_many(self, players: List[PlayerModel]) -> List[str]:
+        """Save many players to file system"""
+        return [self.save(player) for player in players]
+    
     def load(self, player_id: str) -> PlayerModel:
         """Load a player from file system"""
         try:
@@ -127,6 +146,16 @@ class FilePlayerStorageAdapter:
         except Exception as e:
             raise ValueError(f"Error loading player {player_id}: {str(e)}")
     
+    def load_many(self, player_ids: List[str]) -> Dict[str, PlayerModel]:
+        """Load the players that exist among player_ids, keyed by ID"""
+        players = {}
+        for player_id in player_ids:
+            try:
+                players[player_id] = self.load(player_id)
+            except ValueError:
+                continue
+        return players
+    
     def get_all(self) -> List[PlayerModel]:
         """Get all players from file system"""
         players = []
@@ -166,7 +195,7 @@ class FilePlayerStorageAdapter:
             return False
 
 
-class FileTileStorageAdapter:
+class FileTileStorageAdapter(AsyncLoadMixin):
     """File-based storage adapter for Tile entities"""
     
     def __init__(self, data_dir: str = None):
@@ -185,14 +214,18 @@ class FileTileStorageAdapter:
         self.data_dir = data_dir
         os.makedirs(self.data_dir, exist_ok=True)
     
-    def save(self, tile: TileModel) -> str:
-        """Save a tile to file system"""
-        tile_id = f"tile_{tile.position[0]}_{tile.position[1]}"
+    def save(self, tile: TileModel, *, new: bool = False) -> str:
+        """Save a tile to file system (new is accepted for interface parity; files are always overwritten)"""
+        tile_id = tile_id_for(tile.position[0], tile.position[1])
         file_path = os.path.join(self.data_dir, f"tile_save_{tile_id}.json")
         with open(file_path, "w") as f:
             json.dump(tile.model_dump(), f, indent=2)
         return tile_id
     
+    def save_many(self, tiles: List[TileModel]) -> List[str]:
+        """Save many tiles to file system"""
+        return [self.save(tile) for tile in tiles]
+    
     def load(self, tile_id: str) -> TileModel:
         """Load a tile from file system"""
         try:
@@ -205,6 +238,16 @@ class FileTileStorageAdapter:
         except Exception as e:
             raise ValueError(f"Error loading tile {tile_id}: {str(e)}")
     
+    def load_many(self, tile_ids: List[str]) -> Dict[str, TileModel]:
+        """Load the tiles that exist among tile_ids, keyed by ID"""
+        tiles = {}
+        for tile_id in tile_ids:
+            try:
+                tiles[tile_id] = self.load(tile_id)
+            except ValueError:
+                continue
+        return tiles
+    
     def get_all(self) -> List[TileModel]:
         """Get all tiles from file system"""
         tiles = []
@@ -235,7 +278,7 @@ class FileTileStorageAdapter:
     def update(self, tile: TileModel) -> bool:
         """Update an existing tile in file system"""
         try:
-            tile_id = f"tile_{tile.position[0]}_{tile.position[1]}"
+            tile_id = tile_id_for(tile.position[0], tile.position[1])
             file_path = os.path.join(self.data_dir, f"tile_save_{tile_id}.json")
             with open(file_path, "w") as f:
                 json.dump(tile.model_dump(), f, indent=2)
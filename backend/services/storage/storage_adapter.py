@@ -3,7 +3,9 @@ Storage adapter interfaces using Protocol for type checking.
 These define the contract that all storage implementations must follow.
 """
 
-from typing import Protocol, List, TypeVar
+import asyncio
+from functools import lru_cache
+from typing import Protocol, Dict, List, Optional, TypeVar
 from schema.gameModel import GameModel
 from schema.playerModel import PlayerModel
 from schema.tileModel import TileModel
@@ -11,17 +13,63 @@ from schema.turnModel import TurnModel
 
 T = TypeVar('T')
 
+
+class StorageError(ValueError):
+    """
+    A datastore call failed (request rejected, connection dropped, ...).
+    Subclasses ValueError so existing `except ValueError` callers keep working.
+    """
+
+
+@lru_cache(maxsize=4096)
+def tile_id_for(x: int, y: int) -> str:
+    """Storage ID for the tile at (x, y); cached since bulk saves hit the same positions every turn"""
+    return f"tile_{x}_{y}"
+
+
+class AsyncLoadMixin:
+    """
+    Async loading on top of an adapter's blocking load().
+    Each call runs in a worker thread, so independent loads overlap instead of
+    paying one round-trip after another.
+    """
+    
+    async def aload(self, entity_id):
+        """Load one entity without blocking the event loop"""
+        return await asyncio.to_thread(self.load, entity_id)
+    
+    async def aget_many(self, entity_ids: List) -> List:
+        """Load several entities concurrently, in the order given"""
+        return list(await asyncio.gather(*(self.aload(entity_id) for entity_id in entity_ids)))
+
+
 class GameStorageAdapter(Protocol):
     """Interface for game storage operations"""
     
-    def save(self, game: GameModel) -> str:
-        """Save a game and return its ID"""
+    def save(self, game: GameModel, *, new: bool = False) -> str:
+        """Save a game and return its ID; new=True means the caller knows it does not exist yet"""
+        ...
+    
+    def save_many(self, games: List[GameModel]) -> List[str]:
+        """Save many games in bulk and return their IDs"""
         ...
     
     def load(self, game_id: str) -> GameModel:
         """Load a game by ID"""
         ...
     
+    def load_many(self, game_ids: List[str]) -> Dict[str, GameModel]:
+        """Load many games at once, keyed by ID; missing IDs are left out"""
+        ...
+    
+    async def aload(self, game_id: str) -> GameModel:
+        """Load a game by ID without blocking the event loop"""
+        ...
+    
+    async def aget_many(self, game_ids: List[str]) -> List[GameModel]:
+        """Load several games concurrently"""
+        ...
+    
     def get_all(self) -> List[GameModel]:
         """Get all games"""
         ...
@@ -38,14 +86,30 @@ class GameStorageAdapter(Protocol):
 class PlayerStorageAdapter(Protocol):
     """Interface for player storage operations"""
     
-    def save(self, player: PlayerModel) -> str:
-        """Save a player and return its ID"""
+    def save(self, player: PlayerModel, *, new: bool = False) -> str:
+        """Save a player and return its ID; new=True means the caller knows it does not exist yet"""
+        ...
+    
+    def save_many(self, players: List[PlayerModel]) -> List[str]:
+        """Save many players in bulk and return their IDs"""
         ...
     
     def load(self, player_id: str) -> PlayerModel:
         """Load a player by ID"""
         ...
     
+    def load_many(self, player_ids: List[str]) -> Dict[str, PlayerModel]:
+        """Load many players at once, keyed by ID; missing IDs are left out"""
+        ...
+    
+    async def aload(self, player_id: str) -> PlayerModel:
+        """Load a player by ID without blocking the event loop"""
+        ...
+    
+    async def aget_many(self, player_ids: List[str]) -> List[PlayerModel]:
+        """Load several players concurrently"""
+        ...
+    
     def get_all(self) -> List[PlayerModel]:
         """Get all players"""
         ...
@@ -62,14 +126,30 @@ class PlayerStorageAdapter(Protocol):
 class TileStorageAdapter(Protocol):
     """Interface for tile storage operations"""
     
-    def save(self, tile: TileModel) -> str:
-        """Save a tile and return its ID"""
+    def save(self, tile: TileModel, *, new: bool = False) -> str:
+        """Save a tile and return its ID; new=True means the caller knows it does not exist yet"""
+        ...
+    
+    def save_many(self, tiles: List[TileModel]) -> List[str]:
+        """Save many tiles in bulk and return their IDs"""
         ...
     
     def load(self, tile_id: str) -> TileModel:
         """Load a tile by ID"""
         ...
     
+    def load_many(self, tile_ids: List[str]) -> Dict[str, TileModel]:
+        """Load many tiles at once, keyed by ID; missing IDs are left out"""
+        ...
+    
+    async def aload(self, tile_id: str) -> TileModel:
+        """Load a tile by ID without blocking the event loop"""
+        ...
+    
+    async def aget_many(self, tile_ids: List[str]) -> List[TileModel]:
+        """Load several tiles concurrently"""
+        ...
+    
     def get_all(self) -> List[TileModel]:
         """Get all tiles"""
         ...
@@ -90,12 +170,28 @@ class TurnStorageAdapter(Protocol):
         """Save a turn and return its ID"""
         ...
     
+    def save_many(self, turns: List[TurnModel]) -> List[int]:
+        """Save many turns in bulk and return their IDs"""
+        ...
+    
     def load(self, turn_id: int) -> TurnModel:
         """Load a turn by ID"""
         ...
     
-    def get_by_game_id(self, game_id: str) -> List[TurnModel]:
-        """Get all turns for a specific game"""
+    def load_many(self, turn_ids: List[int]) -> Dict[int, TurnModel]:
+        """Load many turns at once, keyed by ID; missing IDs are left out"""
+        ...
+    
+    async def aload(self, turn_id: int) -> TurnModel:
+        """Load a turn by ID without blocking the event loop"""
+        ...
+    
+    async def aget_many(self, turn_ids: List[int]) -> List[TurnModel]:
+        """Load several turns concurrently"""
+        ...
+    
+    def get_by_game_id(self, game_id: str, limit: Optional[int] = None) -> List[TurnModel]:
+        """Get turns for a specific game, optionally only the most recent `limit`"""
         ...
     
     def get_latest_by_game_id(self, game_id: str) -> TurnModel:
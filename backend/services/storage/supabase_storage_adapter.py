@@ -1,24 +1,172 @@
 """
 Supabase storage adapter implementations.
 Uses Supabase PostgreSQL database for persistence.
+
+Turn reads rely on the composite index from database/supabase_schema.sql:
+    CREATE INDEX idx_turns_game_turn ON turns(game_id, turn_number DESC);
+It serves both get_latest_by_game_id (ORDER BY ... LIMIT 1) and a limited
+get_by_game_id as an index scan instead of a scan plus sort.
 """
 
-from typing import List, Optional
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from schema.gameModel import GameModel
-from schema.playerModel import PlayerModel
-from schema.tileModel import TileModel
+from schema.playerModel import PlayerModel, PlayerValuesModel
+from schema.tileModel import TileModel, SecretKV
 from schema.turnModel import TurnModel
+from schema.rowModel import RowModel
+from services.storage.storage_adapter import AsyncLoadMixin, StorageError, tile_id_for
 
 try:
-    from supabase import create_client, Client
+    from supabase import create_client, Client, ClientOptions
+    from postgrest.types import ReturnMethod
+    from postgrest.exceptions import APIError
+    from httpx import HTTPError, Client as HTTPClient, Headers, Limits
+    # Failures the client can actually raise: PostgREST errors and transport errors
+    DB_ERRORS = (APIError, HTTPError)
     SUPABASE_AVAILABLE = True
 except ImportError:
     SUPABASE_AVAILABLE = False
     Client = None
+    ReturnMethod = None
+    DB_ERRORS = ()
+
+try:
+    import orjson
+except ImportError:  # Optional: without it httpx encodes request bodies with the stdlib json module
+    orjson = None
+
+# Connection pool shared by every adapter; small enough to stay well under Supabase's client cap
+POOL_MAX_CONNECTIONS = 10
+POOL_KEEPALIVE_SECONDS = 30.0
+# Matches postgrest's own default request timeout
+HTTP_TIMEOUT_SECONDS = 120
+
+
+if SUPABASE_AVAILABLE:
+    class _OrjsonHTTPClient(HTTPClient):
+        """
+        httpx client that encodes JSON request bodies with orjson straight to bytes.
+        postgrest always hands rows to httpx as json=..., and turn rows carry the
+        whole game state, so this is where most of the encoding time goes.
+        """
+        def build_request(self, method, url, *, json=None, headers=None, **kwargs):
+            if json is None:
+                return super().build_request(method, url, headers=headers, **kwargs)
+            headers = Headers(headers)
+            headers.setdefault("Content-Type", "application/json")
+            # httpx passes content=None alongside json=..., so replace it rather than adding another
+            kwargs["content"] = orjson.dumps(json)
+            return super().build_request(method, url, headers=headers, **kwargs)
+
+
+def _http_client(transport=None) -> "HTTPClient":
+    """Pooled httpx client for Supabase requests; transport is only passed by tests"""
+    client_cls = _OrjsonHTTPClient if orjson is not None else HTTPClient
+    return client_cls(
+        limits=Limits(
+            max_connections=POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=POOL_MAX_CONNECTIONS,
+            keepalive_expiry=POOL_KEEPALIVE_SECONDS,
+        ),
+        timeout=HTTP_TIMEOUT_SECONDS,
+        follow_redirects=True,
+        http2=True,
+        transport=transport,
+    )
+
+
+@lru_cache(maxsize=None)
+def _shared_client(supabase_url: str, supabase_key: str) -> "Client":
+    """
+    One Supabase client per project, backed by one pooled HTTP session.
+    The storage factory builds a new adapter per call, so without this every
+    save/load would open fresh connections (and TLS handshakes) to Supabase.
+    """
+    if "httpx_client" not in getattr(ClientOptions, "__dataclass_fields__", {}):
+        # Older supabase-py 2.x releases can't take a shared httpx client
+        print("Warning: This supabase version can't share an HTTP connection pool; upgrade supabase to enable it")
+        return create_client(supabase_url, supabase_key)
+    return create_client(supabase_url, supabase_key, options=ClientOptions(httpx_client=_http_client()))
+
+
+# How long get_latest_by_game_id may serve a cached turn before hitting the DB again
+LATEST_TURN_TTL = 1.0
+
+# PostgREST caps a single response at 1000 rows by default, so get_all pages through
+PAGE_SIZE = 1000
+
+
+def _fetch_all_rows(build_query) -> List[dict]:
+    """
+    Page through a select query with .range() until a short page comes back.
+
+    Args:
+        build_query: Zero-arg callable returning a fresh filtered/ordered select query
+    """
+    rows = []
+    offset = 0
+    while True:
+        page = build_query().range(offset, offset + PAGE_SIZE - 1).execute().data or []
+        rows.extend(page)
+        if len(page) < PAGE_SIZE:
+            return rows
+        offset += PAGE_SIZE
+
+
+# Rows per bulk write request; keeps each PostgREST payload comfortably small
+BATCH_SIZE = 1000
+
+
+# IDs per .in_() filter; they travel in the query string, so keep URLs a sane length
+IN_BATCH_SIZE = 200
+
+
+def _chunks(items: list, size: int = BATCH_SIZE):
+    """Yield consecutive slices of at most `size` items"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _to_row(model, exclude: Optional[set] = None) -> dict:
+    """
+    Dump a model to a JSON-ready row in a single pydantic-core pass.
+    mode="json" turns enums, tuples etc. into plain JSON types up front, so the
+    request body encoder only ever sees primitives. None values are dropped so
+    database defaults (e.g., created_at) can apply.
+    Without exclusions the model's cached row is reused; callers must not mutate it.
+    """
+    if not exclude and isinstance(model, RowModel):
+        return model.to_row()
+    return model.model_dump(mode="json", exclude=exclude, exclude_none=True)
+
+
+def _player_from_row(row: dict) -> PlayerModel:
+    """Build a PlayerModel from a trusted DB row without re-running validation"""
+    values = row.get("values")
+    if isinstance(values, dict):
+        row["values"] = PlayerValuesModel.model_construct(**values)
+    return PlayerModel.model_construct(**row)
+
+
+def _tile_from_row(row: dict) -> TileModel:
+    """Build a TileModel from a trusted DB row (selected with _SELECT_COLS) without re-running validation"""
+    # Legacy rows store secrets as {name: value} or [name, value]; normalize them as validation would
+    row = TileModel.transform_secrets(row)
+    secrets = row.get("secrets")
+    if secrets:
+        if not all(isinstance(secret, dict) for secret in secrets):
+            return TileModel.model_validate(row)  # Unknown shape: let validation accept or reject it
+        row["secrets"] = [SecretKV.model_construct(**secret) for secret in secrets]
+    return TileModel.model_construct(**row)
 
 
-class SupabaseGameStorageAdapter:
+class SupabaseGameStorageAdapter(AsyncLoadMixin):
     """Supabase-based storage adapter for Game entities"""
+
+    # Only fetch columns the model maps, not whatever else lives on the table
+    _SELECT_COLS = ",".join(GameModel.model_fields)
     
     def __init__(self, supabase_url: str, supabase_key: str, table_name: str = "games"):
         """
@@ -34,49 +182,75 @@ class SupabaseGameStorageAdapter:
                 "Supabase client not available. Install it with: pip install supabase"
             )
         
-        self.client: Client = create_client(supabase_url, supabase_key)
+        self.client: Client = _shared_client(supabase_url, supabase_key)
         self.table_name = table_name
     
-    def save(self, game: GameModel) -> str:
-        """Save a game to Supabase"""
+    def save(self, game: GameModel, *, new: bool = False) -> str:
+        """Save a game to Supabase; pass new=True to plain-insert a row known not to exist"""
         try:
             # Exclude None values to allow database defaults (e.g., created_at) to apply
-            data = game.model_dump(exclude_none=True)
-            # Upsert (insert or update)
-            response = self.client.table(self.table_name).upsert(data).execute()
+            data = _to_row(game)
+            # Known-new rows skip the ON CONFLICT check; otherwise upsert (insert or update).
+            # Only the id is returned, so PostgREST needn't echo the row back.
+            query = self.client.table(self.table_name)
+            write = query.insert if new else query.upsert
+            response = write(data, returning=ReturnMethod.minimal).execute()
             return game.id
-        except Exception as e:
-            raise ValueError(f"Error saving game to Supabase: {str(e)}")
+        except DB_ERRORS as e:
+            raise StorageError(f"Error saving game to Supabase: {str(e)}") from e
+    
+    def save_many(self, games: List[GameModel]) -> List[str]:
+        """Upsert many games with one request per batch"""
+        try:
+            data = [_to_row(game) for game in games]
+            for chunk in _chunks(data):
+                self.client.table(self.table_name).upsert(chunk, returning=ReturnMethod.minimal).execute()
+            return [game.id for game in games]
+        except DB_ERRORS as e:
+            raise StorageError(f"Error saving games to Supabase: {str(e)}") from e
     
     def load(self, game_id: str) -> GameModel:
         """Load a game from Supabase"""
         try:
-            response = self.client.table(self.table_name).select("*").eq("id", game_id).execute()
+            response = self.client.table(self.table_name).select(self._SELECT_COLS).eq("id", game_id).limit(1).execute()
             
             if not response.data or len(response.data) == 0:
                 raise ValueError(f"Game with ID {game_id} not found")
             
             return GameModel(**response.data[0])
-        except ValueError:
-            raise
-        except Exception as e:
-            raise ValueError(f"Error loading game {game_id} from Supabase: {str(e)}")
+        except DB_ERRORS as e:
+            raise StorageError(f"Error loading game {game_id} from Supabase: {str(e)}") from e
+    
+    def load_many(self, game_ids: List[str]) -> Dict[str, GameModel]:
+        """Load many games with one .in_() request per batch; IDs that don't exist are left out"""
+        games = {}
+        try:
+            for chunk in _chunks(list(game_ids), IN_BATCH_SIZE):
+                response = self.client.table(self.table_name).select(self._SELECT_COLS).in_("id", chunk).execute()
+                for row in response.data:
+                    games[row["id"]] = GameModel.model_validate(row)
+        except DB_ERRORS as e:
+            raise StorageError(f"Error loading games from Supabase: {str(e)}") from e
+        return games
     
     def get_all(self) -> List[GameModel]:
         """Get all games from Supabase"""
         try:
-            response = self.client.table(self.table_name).select("*").order("created_at", desc=True).execute()
-            return [GameModel(**item) for item in response.data]
-        except Exception as e:
+            rows = _fetch_all_rows(
+                lambda: self.client.table(self.table_name).select(self._SELECT_COLS).order("created_at", desc=True)
+            )
+            # Games carry an enum status and nested player configs, so keep validation here
+            return [GameModel.model_validate(item) for item in rows]
+        except DB_ERRORS as e:
             print(f"Error loading games from Supabase: {str(e)}")
             return []
     
     def delete(self, game_id: str) -> bool:
         """Delete a game from Supabase"""
         try:
-            response = self.client.table(self.table_name).delete().eq("id", game_id).execute()
+            response = self.client.table(self.table_name).delete(returning=ReturnMethod.minimal).eq("id", game_id).execute()
             return True
-        except Exception as e:
+        except DB_ERRORS as e:
             print(f"Error deleting game {game_id} from Supabase: {str(e)}")
             return False
     
@@ -84,16 +258,19 @@ class SupabaseGameStorageAdapter:
         """Update an existing game in Supabase"""
         try:
             # Exclude None values to prevent overwriting with null
-            data = game.model_dump(exclude_none=True)
-            response = self.client.table(self.table_name).update(data).eq("id", game.id).execute()
+            data = _to_row(game)
+            response = self.client.table(self.table_name).update(data, returning=ReturnMethod.minimal).eq("id", game.id).execute()
             return True
-        except Exception as e:
+        except DB_ERRORS as e:
             print(f"Error updating game {game.id} in Supabase: {str(e)}")
             return False
 
 
-class SupabasePlayerStorageAdapter:
+class SupabasePlayerStorageAdapter(AsyncLoadMixin):
     """Supabase-based storage adapter for Player entities"""
+
+    # Only fetch columns the model maps, not whatever else lives on the table
+    _SELECT_COLS = ",".join(PlayerModel.model_fields)
     
     def __init__(self, supabase_url: str, supabase_key: str, table_name: str = "players"):
         """
@@ -109,49 +286,74 @@ class SupabasePlayerStorageAdapter:
                 "Supabase client not available. Install it with: pip install supabase"
             )
         
-        self.client: Client = create_client(supabase_url, supabase_key)
+        self.client: Client = _shared_client(supabase_url, supabase_key)
         self.table_name = table_name
     
-    def save(self, player: PlayerModel) -> str:
-        """Save a player to Supabase"""
+    def save(self, player: PlayerModel, *, new: bool = False) -> str:
+        """Save a player to Supabase; pass new=True to plain-insert a row known not to exist"""
         try:
             # Exclude None values to allow database defaults to apply
-            data = player.model_dump(exclude_none=True)
-            # Upsert (insert or update)
-            response = self.client.table(self.table_name).upsert(data).execute()
+            data = _to_row(player)
+            # Known-new rows skip the ON CONFLICT check; otherwise upsert (insert or update).
+            # Only the id is returned, so PostgREST needn't echo the row back.
+            query = self.client.table(self.table_name)
+            write = query.insert if new else query.upsert
+            response = write(data, returning=ReturnMethod.minimal).execute()
             return player.uid
-        except Exception as e:
-            raise ValueError(f"Error saving player to Supabase: {str(e)}")
+        except DB_ERRORS as e:
+            raise StorageError(f"Error saving player to Supabase: {str(e)}") from e
+    
+    def save_many(self, players: List[PlayerModel]) -> List[str]:
+        """Upsert many players with one request per batch"""
+        try:
+            data = [_to_row(player) for player in players]
+            for chunk in _chunks(data):
+                self.client.table(self.table_name).upsert(chunk, returning=ReturnMethod.minimal).execute()
+            return [player.uid for player in players]
+        except DB_ERRORS as e:
+            raise StorageError(f"Error saving players to Supabase: {str(e)}") from e
     
     def load(self, player_id: str) -> PlayerModel:
         """Load a player from Supabase"""
         try:
-            response = self.client.table(self.table_name).select("*").eq("uid", player_id).execute()
+            response = self.client.table(self.table_name).select(self._SELECT_COLS).eq("uid", player_id).limit(1).execute()
             
             if not response.data or len(response.data) == 0:
                 raise ValueError(f"Player with ID {player_id} not found")
             
             return PlayerModel(**response.data[0])
-        except ValueError:
-            raise
-        except Exception as e:
-            raise ValueError(f"Error loading player {player_id} from Supabase: {str(e)}")
+        except DB_ERRORS as e:
+            raise StorageError(f"Error loading player {player_id} from Supabase: {str(e)}") from e
+    
+    def load_many(self, player_ids: List[str]) -> Dict[str, PlayerModel]:
+        """Load many players with one .in_() request per batch; IDs that don't exist are left out"""
+        players = {}
+        try:
+            for chunk in _chunks(list(player_ids), IN_BATCH_SIZE):
+                response = self.client.table(self.table_name).select(self._SELECT_COLS).in_("uid", chunk).execute()
+                for row in response.data:
+                    players[row["uid"]] = _player_from_row(row)
+        except DB_ERRORS as e:
+            raise StorageError(f"Error loading players from Supabase: {str(e)}") from e
+        return players
     
     def get_all(self) -> List[PlayerModel]:
         """Get all players from Supabase"""
         try:
-            response = self.client.table(self.table_name).select("*").execute()
-            return [PlayerModel(**item) for item in response.data]
-        except Exception as e:
+            rows = _fetch_all_rows(
+                lambda: self.client.table(self.table_name).select(self._SELECT_COLS).order("uid")
+            )
+            return [_player_from_row(item) for item in rows]
+        except DB_ERRORS as e:
             print(f"Error loading players from Supabase: {str(e)}")
             return []
     
     def delete(self, player_id: str) -> bool:
         """Delete a player from Supabase"""
         try:
-            response = self.client.table(self.table_name).delete().eq("uid", player_id).execute()
+            response = self.client.table(self.table_name).delete(returning=ReturnMethod.minimal).eq("uid", player_id).execute()
             return True
-        except Exception as e:
+        except DB_ERRORS as e:
             print(f"Error deleting player {player_id} from Supabase: {str(e)}")
             return False
     
@@ -159,16 +361,19 @@ class SupabasePlayerStorageAdapter:
         """Update an existing player in Supabase"""
         try:
             # Exclude None values to prevent overwriting with null
-            data = player.model_dump(exclude_none=True)
-            response = self.client.table(self.table_name).update(data).eq("uid", player.uid).execute()
+            data = _to_row(player)
+            response = self.client.table(self.table_name).update(data, returning=ReturnMethod.minimal).eq("uid", player.uid).execute()
             return True
-        except Exception as e:
+        except DB_ERRORS as e:
             print(f"Error updating player {player.uid} in Supabase: {str(e)}")
             return False
 
 
-class SupabaseTileStorageAdapter:
+class SupabaseTileStorageAdapter(AsyncLoadMixin):
     """Supabase-based storage adapter for Tile entities"""
+
+    # Only fetch columns the model maps, not whatever else lives on the table
+    _SELECT_COLS = ",".join(TileModel.model_fields)
     
     def __init__(self, supabase_url: str, supabase_key: str, table_name: str = "tiles"):
         """
@@ -184,77 +389,107 @@ class SupabaseTileStorageAdapter:
                 "Supabase client not available. Install it with: pip install supabase"
             )
         
-        self.client: Client = create_client(supabase_url, supabase_key)
+        self.client: Client = _shared_client(supabase_url, supabase_key)
         self.table_name = table_name
     
-    def save(self, tile: TileModel) -> str:
-        """Save a tile to Supabase"""
+    def save(self, tile: TileModel, *, new: bool = False) -> str:
+        """Save a tile to Supabase; pass new=True to plain-insert a row known not to exist"""
         try:
-            tile_id = f"tile_{tile.position[0]}_{tile.position[1]}"
+            tile_id = tile_id_for(tile.position[0], tile.position[1])
             # Exclude None values to allow database defaults to apply
-            data = tile.model_dump(exclude_none=True)
-            data["tile_id"] = tile_id  # Add explicit tile_id for lookup
-            # Upsert (insert or update)
-            response = self.client.table(self.table_name).upsert(data).execute()
+            # Add explicit tile_id for lookup (copy, since the dumped row may be cached)
+            data = {**_to_row(tile), "tile_id": tile_id}
+            # Known-new rows skip the ON CONFLICT check; otherwise upsert (insert or update).
+            # Only the id is returned, so PostgREST needn't echo the row back.
+            query = self.client.table(self.table_name)
+            write = query.insert if new else query.upsert
+            response = write(data, returning=ReturnMethod.minimal).execute()
             return tile_id
-        except Exception as e:
-            raise ValueError(f"Error saving tile to Supabase: {str(e)}")
+        except DB_ERRORS as e:
+            raise StorageError(f"Error saving tile to Supabase: {str(e)}") from e
+    
+    def save_many(self, tiles: List[TileModel]) -> List[str]:
+        """Upsert many tiles with one request per batch"""
+        try:
+            tile_ids = []
+            data = []
+            for tile in tiles:
+                tile_id = tile_id_for(tile.position[0], tile.position[1])
+                tile_ids.append(tile_id)
+                data.append({**_to_row(tile), "tile_id": tile_id})
+            for chunk in _chunks(data):
+                self.client.table(self.table_name).upsert(chunk, returning=ReturnMethod.minimal).execute()
+            return tile_ids
+        except DB_ERRORS as e:
+            raise StorageError(f"Error saving tiles to Supabase: {str(e)}") from e
     
     def load(self, tile_id: str) -> TileModel:
         """Load a tile from Supabase"""
         try:
-            response = self.client.table(self.table_name).select("*").eq("tile_id", tile_id).execute()
+            response = self.client.table(self.table_name).select(self._SELECT_COLS).eq("tile_id", tile_id).limit(1).execute()
             
             if not response.data or len(response.data) == 0:
                 raise ValueError(f"Tile with ID {tile_id} not found")
             
-            # Remove tile_id before creating model
-            data = response.data[0]
-            data.pop("tile_id", None)
-            return TileModel(**data)
-        except ValueError:
-            raise
-        except Exception as e:
-            raise ValueError(f"Error loading tile {tile_id} from Supabase: {str(e)}")
+            # tile_id is not in _SELECT_COLS, so the row maps straight onto the model
+            return TileModel(**response.data[0])
+        except DB_ERRORS as e:
+            raise StorageError(f"Error loading tile {tile_id} from Supabase: {str(e)}") from e
+    
+    def load_many(self, tile_ids: List[str]) -> Dict[str, TileModel]:
+        """Load many tiles with one .in_() request per batch; IDs that don't exist are left out"""
+        tiles = {}
+        try:
+            for chunk in _chunks(list(tile_ids), IN_BATCH_SIZE):
+                response = self.client.table(self.table_name).select(self._SELECT_COLS).in_("tile_id", chunk).execute()
+                for row in response.data:
+                    tiles[tile_id_for(*row["position"])] = _tile_from_row(row)
+        except DB_ERRORS as e:
+            raise StorageError(f"Error loading tiles from Supabase: {str(e)}") from e
+        return tiles
     
     def get_all(self) -> List[TileModel]:
         """Get all tiles from Supabase"""
         try:
-            response = self.client.table(self.table_name).select("*").execute()
-            tiles = []
-            for item in response.data:
-                # Remove tile_id before creating model
-                item.pop("tile_id", None)
-                tiles.append(TileModel(**item))
-            return tiles
-        except Exception as e:
+            rows = _fetch_all_rows(
+                lambda: self.client.table(self.table_name).select(self._SELECT_COLS).order("tile_id")
+            )
+            return [_tile_from_row(item) for item in rows]
+        except DB_ERRORS as e:
             print(f"Error loading tiles from Supabase: {str(e)}")
             return []
     
     def delete(self, tile_id: str) -> bool:
         """Delete a tile from Supabase"""
         try:
-            response = self.client.table(self.table_name).delete().eq("tile_id", tile_id).execute()
+            response = self.client.table(self.table_name).delete(returning=ReturnMethod.minimal).eq("tile_id", tile_id).execute()
             return True
-        except Exception as e:
+        except DB_ERRORS as e:
             print(f"Error deleting tile {tile_id} from Supabase: {str(e)}")
             return False
     
     def update(self, tile: TileModel) -> bool:
         """Update an existing tile in Supabase"""
         try:
-            tile_id = f"tile_{tile.position[0]}_{tile.position[1]}"
+            tile_id = tile_id_for(tile.position[0], tile.position[1])
             # Exclude None values to prevent overwriting with null
-            data = tile.model_dump(exclude_none=True)
-            response = self.client.table(self.table_name).update(data).eq("tile_id", tile_id).execute()
+            data = _to_row(tile)
+            response = self.client.table(self.table_name).update(data, returning=ReturnMethod.minimal).eq("tile_id", tile_id).execute()
             return True
-        except Exception as e:
+        except DB_ERRORS as e:
             print(f"Error updating tile in Supabase: {str(e)}")
             return False
 
 
-class SupabaseTurnStorageAdapter:
+class SupabaseTurnStorageAdapter(AsyncLoadMixin):
     """Supabase-based storage adapter for Turn entities"""
+
+    # Only fetch columns the model maps, not whatever else lives on the table
+    _SELECT_COLS = ",".join(TurnModel.model_fields)
+
+    # Shared across instances since the factory builds a new adapter per call.
+    # (table_name, game_id) -> (fetched_at, latest turn); dropped whenever that game's turns change.
+    _latest_cache: Dict[Tuple[str, str], Tuple[float, TurnModel]] = {}
     
     def __init__(self, supabase_url: str, supabase_key: str, table_name: str = "turns"):
         """
@@ -270,7 +505,7 @@ class SupabaseTurnStorageAdapter:
                 "Supabase client not available. Install it with: pip install supabase"
             )
         
-        self.client: Client = create_client(supabase_url, supabase_key)
+        self.client: Client = _shared_client(supabase_url, supabase_key)
         self.table_name = table_name
     
     def save(self, turn: TurnModel) -> int:
@@ -278,68 +513,121 @@ class SupabaseTurnStorageAdapter:
         try:
             # Exclude None values to allow database defaults (e.g., created_at) to apply
             exclude_fields = {'id'} if turn.id is None else set()
-            data = turn.model_dump(exclude=exclude_fields, exclude_none=True)
+            data = _to_row(turn, exclude=exclude_fields)
             # Insert new turn
             response = self.client.table(self.table_name).insert(data).execute()
             
             if not response.data or len(response.data) == 0:
-                raise ValueError("Failed to insert turn: no data returned")
+                raise StorageError("Failed to insert turn: no data returned")
             
+            self._invalidate_latest(turn.game_id)
             return response.data[0]['id']
-        except Exception as e:
-            raise ValueError(f"Error saving turn to Supabase: {str(e)}")
+        except DB_ERRORS as e:
+            raise StorageError(f"Error saving turn to Supabase: {str(e)}") from e
+    
+    def save_many(self, turns: List[TurnModel]) -> List[int]:
+        """Insert many turns with one request per batch and return their IDs in order"""
+        try:
+            data = [
+                _to_row(turn, exclude={'id'} if turn.id is None else set())
+                for turn in turns
+            ]
+            turn_ids = []
+            for chunk in _chunks(data):
+                response = self.client.table(self.table_name).insert(chunk).execute()
+                if not response.data or len(response.data) != len(chunk):
+                    raise StorageError("Failed to insert turns: incomplete data returned")
+                turn_ids.extend(row['id'] for row in response.data)
+            for game_id in {turn.game_id for turn in turns}:
+                self._invalidate_latest(game_id)
+            return turn_ids
+        except DB_ERRORS as e:
+            raise StorageError(f"Error saving turns to Supabase: {str(e)}") from e
     
     def load(self, turn_id: int) -> TurnModel:
         """Load a turn from Supabase"""
         try:
-            response = self.client.table(self.table_name).select("*").eq("id", turn_id).execute()
+            response = self.client.table(self.table_name).select(self._SELECT_COLS).eq("id", turn_id).limit(1).execute()
             
             if not response.data or len(response.data) == 0:
                 raise ValueError(f"Turn with ID {turn_id} not found")
             
             return TurnModel(**response.data[0])
-        except ValueError:
-            raise
-        except Exception as e:
-            raise ValueError(f"Error loading turn {turn_id} from Supabase: {str(e)}")
+        except DB_ERRORS as e:
+            raise StorageError(f"Error loading turn {turn_id} from Supabase: {str(e)}") from e
     
-    def get_by_game_id(self, game_id: str) -> List[TurnModel]:
-        """Get all turns for a specific game, ordered by turn_number"""
+    def load_many(self, turn_ids: List[int]) -> Dict[int, TurnModel]:
+        """Load many turns with one .in_() request per batch; IDs that don't exist are left out"""
+        turns = {}
         try:
-            response = self.client.table(self.table_name).select("*").eq("game_id", game_id).order("turn_number", desc=False).execute()
-            return [TurnModel(**item) for item in response.data]
-        except Exception as e:
+            for chunk in _chunks(list(turn_ids), IN_BATCH_SIZE):
+                response = self.client.table(self.table_name).select(self._SELECT_COLS).in_("id", chunk).execute()
+                for row in response.data:
+                    turns[row["id"]] = TurnModel(**row)
+        except DB_ERRORS as e:
+            raise StorageError(f"Error loading turns from Supabase: {str(e)}") from e
+        return turns
+    
+    def get_by_game_id(self, game_id: str, limit: Optional[int] = None) -> List[TurnModel]:
+        """
+        Get turns for a specific game, ordered by turn_number
+
+        Args:
+            game_id: Game to fetch turns for
+            limit: If set, only the most recent `limit` turns are fetched
+        """
+        try:
+            query = self.client.table(self.table_name).select(self._SELECT_COLS).eq("game_id", game_id)
+            if limit is None:
+                response = query.order("turn_number", desc=False).execute()
+                return [TurnModel(**item) for item in response.data]
+            # Walk the index newest-first and flip back to ascending order
+            response = query.order("turn_number", desc=True).limit(limit).execute()
+            return [TurnModel(**item) for item in reversed(response.data)]
+        except DB_ERRORS as e:
             print(f"Error loading turns for game {game_id} from Supabase: {str(e)}")
             return []
     
     def get_latest_by_game_id(self, game_id: str) -> TurnModel:
-        """Get the latest turn for a specific game"""
+        """Get the latest turn for a specific game, served from a short-lived cache when fresh"""
+        key = (self.table_name, game_id)
+        cached = self._latest_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < LATEST_TURN_TTL:
+            return cached[1]
         try:
-            response = self.client.table(self.table_name).select("*").eq("game_id", game_id).order("turn_number", desc=True).limit(1).execute()
+            response = self.client.table(self.table_name).select(self._SELECT_COLS).eq("game_id", game_id).order("turn_number", desc=True).limit(1).execute()
             
             if not response.data or len(response.data) == 0:
                 raise ValueError(f"No turns found for game {game_id}")
             
-            return TurnModel(**response.data[0])
-        except ValueError:
-            raise
-        except Exception as e:
-            raise ValueError(f"Error loading latest turn for game {game_id} from Supabase: {str(e)}")
+            turn = TurnModel(**response.data[0])
+            self._latest_cache[key] = (time.monotonic(), turn)
+            return turn
+        except DB_ERRORS as e:
+            raise StorageError(f"Error loading latest turn for game {game_id} from Supabase: {str(e)}") from e
     
     def delete(self, turn_id: int) -> bool:
         """Delete a turn from Supabase"""
         try:
-            response = self.client.table(self.table_name).delete().eq("id", turn_id).execute()
+            response = self.client.table(self.table_name).delete(returning=ReturnMethod.minimal).eq("id", turn_id).execute()
+            # The owning game isn't known here, so drop every cached turn for this table
+            for key in [k for k in self._latest_cache if k[0] == self.table_name]:
+                self._latest_cache.pop(key, None)
             return True
-        except Exception as e:
+        except DB_ERRORS as e:
             print(f"Error deleting turn {turn_id} from Supabase: {str(e)}")
             return False
     
     def delete_by_game_id(self, game_id: str) -> bool:
         """Delete all turns for a specific game"""
         try:
-            response = self.client.table(self.table_name).delete().eq("game_id", game_id).execute()
+            response = self.client.table(self.table_name).delete(returning=ReturnMethod.minimal).eq("game_id", game_id).execute()
+            self._invalidate_latest(game_id)
             return True
-        except Exception as e:
+        except DB_ERRORS as e:
             print(f"Error deleting turns for game {game_id} from Supabase: {str(e)}")
             return False
+    
+    def _invalidate_latest(self, game_id: str) -> None:
+        """Forget the cached latest turn for a game after its turns change"""
+        self._latest_cache.pop((self.table_name, game_id), None)
@@ -3,101 +3,307 @@ from database.fileManager import Savable
 from src.services.Utils import format_request
 from src.services.aiServices.wrapper import AIWrapper
 from api.apiDtoModel import GameResponse
-from core.settings import AIConfig
+from core.settings import AIConfig, GameConfig
 from typing import Dict, Optional
 from typing_extensions import override
-from schema.tileModel import TileModel
+from collections import deque
+from functools import lru_cache
+import json
+import time
+import uuid
+import zlib
+from src.services.aiServices.openai import shared_openai_client
+from schema.tileModel import TileModel, TileBatchModel
 from schema.characterModel import load_character_template
+from pydantic import BaseModel
+
+# Only the most recent verdicts are kept in memory; older ones live in saved turns
+MAX_RESPONSE_HISTORY = 256
+
+# OpenAI Batch API polling for generate_tiles_via_batch_api
+BATCH_POLL_SECONDS = 30.0
+BATCH_TIMEOUT_SECONDS = 24 * 3600
+BATCH_FINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+# Default chat session for tile generation, kept apart from the DM's verdict session
+TILE_SESSION_ID = "DungeonMaster:tilegen"
+
+@lru_cache(maxsize=64)
+def _template_view(template_name: str) -> dict:
+    """
+    Static, prompt-ready view of a template (traits, attributes, skills).
+    Shared across players and turns, so callers must not mutate it.
+    """
+    template = load_character_template(template_name)
+    return {
+        'race': template.race,
+        'character_class': template.character_class,
+        'racial_traits': [
+            {'name': trait.name, 'description': trait.description, 'effect': trait.mechanical_effect}
+            for trait in template.racial_traits
+        ],
+        'base_attributes': template.base_attributes.to_dict(),
+        'all_skills': [
+            {
+                'name': skill.name,
+                'description': skill.description,
+                'unlock_level': skill.unlock_level,
+                'prerequisites': skill.prerequisites,
+                'attribute_requirements': skill.attribute_requirements,
+                'resource_cost': skill.resource_cost,
+                'cooldown_turns': skill.cooldown_turns,
+                'effect': skill.effect_description,
+                'damage_formula': skill.damage_formula
+            }
+            for skill in template.skills
+        ],
+    }
+
+@lru_cache(maxsize=1024)
+def _tile_request(prompt: str, position: tuple[int, int]) -> str:
+    """Tile prompts depend only on position, so the same grid cells reuse one formatted request"""
+    return format_request(prompt, {"position": position})
+
+def tile_seed(position: tuple[int, int]) -> Optional[int]:
+    """
+    Sampling seed for a tile, derived from GameConfig.world_seed and the position.
+    Tiles are generated lazily in whatever order players reach them, so the seed
+    must depend on the position alone for a seeded world to come out the same.
+    """
+    if GameConfig.world_seed is None:
+        return None
+    return zlib.crc32(f"{GameConfig.world_seed}:{position[0]}:{position[1]}".encode())
 
 class DungeonMaster(Savable):
     model:str
-    _responses: list[str]
+    _responses: deque[str]
+    _response_count: int
     def __init__(self, model: str = "gpt-4.1-mini", loaded_data: dict | None = None):
         self.model = model
-        self._responses = []
+        self._responses = deque(maxlen=MAX_RESPONSE_HISTORY)
+        self._response_count = 0
         if loaded_data is not None:
             self.load(loaded_data)
-    def generate_tile(self, position:tuple[int,int] = (0,0), context: dict | None = None, session_id: str = "DungeonMaster") -> Tile:
+    def generate_tile(self, position:tuple[int,int] = (0,0), context: dict | None = None, session_id: str = TILE_SESSION_ID) -> Tile:
         generated_description = AIWrapper.ask(
-            format_request(AIConfig.tile_prompt, {"position": position}),
+            _tile_request(AIConfig.tile_prompt, tuple(position)),
             self.model,
             session_id,
-            structured_output = TileModel
+            structured_output = TileModel,
+            cache_key = TILE_SESSION_ID,
+            seed = tile_seed(position)
         )
         return Tile(generated_description.description, position, secrets = generated_description.secrets, terrainType=generated_description.terrainType, terrainEmoji=generated_description.terrainEmoji)
+    def generate_tiles_batch(self, positions: list[tuple[int,int]], session_id: str = TILE_SESSION_ID) -> list[Tile]:
+        """
+        Generate several tiles with a single request, sharing the tile instructions.
+        Tiles the model skips or misplaces are generated individually.
+        Unseeded: which positions share a batch depends on visit order, so a batch
+        seed wouldn't reproduce a tile (see tile_seed).
+        """
+        response = AIWrapper.ask(
+            format_request(AIConfig.tile_batch_prompt, {
+                "coordinates": [f"[{index}] {list(position)}" for index, position in enumerate(positions)]
+            }),
+            self.model,
+            session_id,
+            structured_output = TileBatchModel,
+            cache_key = TILE_SESSION_ID
+        )
+        generated = {}
+        if isinstance(response, TileBatchModel):
+            generated = {tuple(tile.position): tile for tile in response.tiles}
+        tiles = []
+        for position in positions:
+            tile_model = generated.get(tuple(position))
+            if tile_model is None:
+                tiles.append(self.generate_tile(position, session_id=session_id))
+            else:
+                tiles.append(Tile(tile_model.description, position, secrets = tile_model.secrets, terrainType=tile_model.terrainType, terrainEmoji=tile_model.terrainEmoji))
+        return tiles
+    def _generate_tiles_regular(self, positions: list[tuple[int,int]]) -> list[Tile]:
+        """
+        Tiles from regular requests, GameConfig.tile_batch_size per generate_tiles_batch call
+        (one per generate_tile call in seeded worlds, so each tile gets its own seed).
+        Every call gets a throwaway session, so tiles don't pile up in a shared chat history.
+        """
+        batch_size = 1 if GameConfig.world_seed is not None else max(1, GameConfig.tile_batch_size)
+        tiles = []
+        for start in range(0, len(positions), batch_size):
+            batch = positions[start:start + batch_size]
+            session_id = f"{TILE_SESSION_ID}_{batch[0][0]}_{batch[0][1]}_{uuid.uuid4().hex}"
+            if len(batch) == 1:
+                tiles.append(self.generate_tile(batch[0], session_id=session_id))
+            else:
+                tiles.extend(self.generate_tiles_batch(batch, session_id=session_id))
+            AIWrapper.reset(session_id)
+        return tiles
+    def generate_tiles_via_batch_api(self, positions: list[tuple[int,int]], poll_interval: float = BATCH_POLL_SECONDS, timeout: float = BATCH_TIMEOUT_SECONDS) -> list[Tile]:
+        """
+        Generate tiles through the OpenAI Batch API: half the price of regular requests,
+        but results can take hours, so only use it when nobody is waiting (e.g. prewarming
+        a world before its game starts). Blocks until the batch ends or timeout seconds pass;
+        positions it didn't answer (all of them after a timeout) are generated with regular
+        requests. Models served by another provider only use regular requests.
+        """
+        if not positions:
+            return []
+        if AIWrapper.provider(self.model) != "openai":
+            return self._generate_tiles_regular(positions)
+
+        client = shared_openai_client()
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {"name": "TileModel", "schema": TileModel.model_json_schema()},
+        }
+        requests = "\n".join(
+            json.dumps({
+                "custom_id": f"tile_{x}_{y}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "temperature": AIConfig.openai_temperature,
+                    "max_tokens": AIConfig.openai_max_tokens,
+                    "messages": [
+                        {"role": "system", "content": AIConfig.system_prompt},
+                        {"role": "user", "content": _tile_request(AIConfig.tile_prompt, (x, y))},
+                    ],
+                    "response_format": response_format,
+                    **({"seed": tile_seed((x, y))} if GameConfig.world_seed is not None else {}),
+                },
+            })
+            for x, y in positions
+        )
+        batch_file = client.files.create(file=("tiles.jsonl", requests.encode("utf-8")), purpose="batch")
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        deadline = time.monotonic() + timeout
+        while batch.status not in BATCH_FINAL_STATUSES:
+            if time.monotonic() > deadline:
+                print(f"Warning: Tile batch {batch.id} timed out, cancelling")
+                batch = client.batches.cancel(batch.id)
+                break
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            print(f"Warning: Tile batch {batch.id} ended with status {batch.status}")
+
+        # Expired or cancelled batches still return the requests they finished
+        generated: dict[str, TileModel] = {}
+        if batch.output_file_id:
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                try:
+                    result = json.loads(line)
+                    content = result["response"]["body"]["choices"][0]["message"]["content"]
+                    generated[result["custom_id"]] = TileModel.model_validate_json(content)
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    print(f"Warning: Skipping unusable tile batch result: {e}")
+
+        tiles: dict[tuple[int,int], Tile] = {}
+        for x, y in positions:
+            tile_model = generated.get(f"tile_{x}_{y}")
+            if tile_model is not None:
+                tiles[(x, y)] = Tile(tile_model.description, (x, y), secrets = tile_model.secrets, terrainType=tile_model.terrainType, terrainEmoji=tile_model.terrainEmoji)
+        missing = [position for position in positions if position not in tiles]
+        if missing:
+            tiles.update(zip(missing, self._generate_tiles_regular(missing)))
+        return [tiles[position] for position in positions]
     def update_tile(self, tile: Tile, event: str):
         tile.update_description(AIWrapper.ask(format_request(AIConfig.tile_update_prompt, {"current_tile_description": tile.description, "event": event}), self.model, "DungeonMaster"))
+    def verdict_request(self, info: dict) -> str:
+        """Full DM prompt for a turn, with character template data added to the players"""
+        return format_request(AIConfig.dm_prompt, self._enrich_info_with_character_templates(info))
     def respond_actions(self, info: dict) -> GameResponse:
-        enriched_info = self._enrich_info_with_character_templates(info)
-        # print("info:", info)
-        # print("enriched_info:", enriched_info)
-        # print("formatted info:", format_request(AIConfig.dm_prompt, info))
         structured_response = AIWrapper.ask(
-            format_request(AIConfig.dm_prompt, enriched_info),
+            self.verdict_request(info),
             self.model,
             "DungeonMaster",
             structured_output = GameResponse
         )
-        self._responses.append(str(structured_response))
+        return self.record_verdict(structured_response)
+    async def arespond_actions(self, info: dict) -> GameResponse:
+        """respond_actions for async callers (Game.astep)"""
+        structured_response = await AIWrapper.aask(
+            self.verdict_request(info),
+            self.model,
+            "DungeonMaster",
+            structured_output = GameResponse
+        )
+        return self.record_verdict(structured_response)
+    def record_verdict(self, structured_response: GameResponse | str | None) -> GameResponse:
+        if isinstance(structured_response, BaseModel):
+            self._responses.append(structured_response.model_dump_json())
+        else:
+            self._responses.append(str(structured_response))
+        self._response_count += 1
         return structured_response
 
     def _enrich_info_with_character_templates(self, info: dict) -> dict:
         enriched = info.copy()
 
         character_templates = {}
-        if 'Players' in info:
-            for uid, player_data in info['Players'].items():
-                try:
-                    if isinstance(player_data, str):
-                        import json
-                        player_data = json.loads(player_data)
+        # Normalize once up front: players may arrive as JSON strings or as dicts
+        players = {}
+        for uid, player_data in (info.get('Players') or {}).items():
+            try:
+                if type(player_data) is str:
+                    player_data = json.loads(player_data)
+                if not isinstance(player_data, dict):
+                    raise TypeError(f"expected an object, got {type(player_data).__name__}")
+                players[uid] = player_data
+            except (json.JSONDecodeError, TypeError) as e:
+                print(f"[DM] Warning: Could not read data for player {uid}: {e}")
 
-                    template_name = player_data.get('character_template_name')
-                    if template_name:
-                        template = load_character_template(template_name)
-                        character_templates[uid] = {
-                            'race': template.race,
-                            'character_class': template.character_class,
-                            'racial_traits': [
-                                {'name': trait.name, 'description': trait.description, 'effect': trait.mechanical_effect}
-                                for trait in template.racial_traits
-                            ],
-                            'base_attributes': template.base_attributes.to_dict(),
-                            'all_skills': [
-                                {
-                                    'name': skill.name,
-                                    'description': skill.description,
-                                    'unlock_level': skill.unlock_level,
-                                    'prerequisites': skill.prerequisites,
-                                    'attribute_requirements': skill.attribute_requirements,
-                                    'resource_cost': skill.resource_cost,
-                                    'cooldown_turns': skill.cooldown_turns,
-                                    'effect': skill.effect_description,
-                                    'damage_formula': skill.damage_formula
-                                }
-                                for skill in template.skills
-                            ],
-                            'current_state': {
-                                'level': player_data.get('level', 1),
-                                'experience': player_data.get('experience', 0),
-                                'current_abilities': player_data.get('current_abilities', []),
-                                'resource_pools': player_data.get('resource_pools', {}),
-                                'skill_cooldowns': player_data.get('skill_cooldowns', {}),
-                                'inventory': player_data.get('values', {}).get('inventory', [])
-                            }
+        # Build each distinct template view once, not once per player
+        template_views = {}
+        for template_name in {p.get('character_template_name') for p in players.values()}:
+            if not template_name:
+                continue
+            try:
+                template_views[template_name] = _template_view(template_name)
+            except (OSError, ValueError) as e:  # missing file or invalid template JSON
+                print(f"[DM] Warning: Could not load template '{template_name}': {e}")
+
+        for uid, player_data in players.items():
+            try:
+                template_name = player_data.get('character_template_name')
+                if template_name in template_views:
+                    character_templates[uid] = {
+                        **template_views[template_name],
+                        'current_state': {
+                            'level': player_data.get('level', 1),
+                            'experience': player_data.get('experience', 0),
+                            'current_abilities': player_data.get('current_abilities', []),
+                            'resource_pools': player_data.get('resource_pools', {}),
+                            'skill_cooldowns': player_data.get('skill_cooldowns', {}),
+                            'inventory': player_data.get('values', {}).get('inventory', [])
                         }
-                    else:
-                        print(f"[DM] Warning: Player {uid} has no character template")
-                except Exception as e:
-                    print(f"[DM] Warning: Could not load template for player {uid}: {e}")
+                    }
+                elif not template_name:
+                    print(f"[DM] Warning: Player {uid} has no character template")
+            except (AttributeError, TypeError) as e:  # malformed player entry
+                print(f"[DM] Warning: Could not load template for player {uid}: {e}")
 
         enriched['character_templates'] = character_templates
         return enriched
-    def get_responses_history(self) -> list[str]:
+    def get_responses_history(self) -> deque[str]:
         return self._responses
+    def get_response_at(self, frame: int) -> str | None:
+        """Verdict from the given turn index, or None if it was never made or has aged out"""
+        index = frame - (self._response_count - len(self._responses))
+        if 0 <= index < len(self._responses):
+            return self._responses[index]
+        return None
+    @override
+    def to_dict(self) -> dict:
+        return {"model": self.model}
     @override
     def save(self):
-        return Savable.toJSON({"model": self.model})
+        return Savable.toJSON(self.to_dict())
     @override
     def load(self, loaded_data):
         if isinstance(loaded_data, str):
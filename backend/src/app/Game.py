@@ -1,9 +1,13 @@
 #Handles game logic and loop
+import asyncio
+import sqlite3
 from concurrent.futures import ThreadPoolExecutor
-from src.app.Player import Player
-from src.app.Tile import Tile
+from functools import lru_cache
+from src.app.Player import Player, DEAD_PLAYER_RESPONSE
+from src.app.Tile import Tile, TileGrid
 from database.fileManager import FileManager, Savable
-from src.app.DungeonMaster import DungeonMaster
+from database.tileCache import TileCache
+from src.app.DungeonMaster import DungeonMaster, BATCH_TIMEOUT_SECONDS
 from src.services.aiServices.wrapper import AIWrapper
 from src.app.GameConditions import (
     GameConditionManager,
@@ -15,8 +19,8 @@ from typing_extensions import override, Any
 import uuid
 from api.apiDtoModel import GameResponse, CharacterState, WorldState
 from schema.gameModel import GameModel, GameStateModel
-from schema.playerModel import PlayerModel
-from schema.tileModel import TileModel
+from schema.playerModel import PlayerModel, PlayerValuesModel
+from schema.tileModel import TileModel, SecretKV
 from schema.dungeonMasterModel import DungeonMasterModel
 from schema.turnModel import TurnModel
 from schema.enums import GameStatus
@@ -24,10 +28,24 @@ from services.database.gameService import save_game_to_database, load_game_from_
 from services.database.turnService import save_turn_to_database, get_latest_turn_by_game_id
 from core.settings import GameConfig
 
+@lru_cache(maxsize=8)
+def _vision_offsets(vision: int) -> tuple[tuple[int, int], ...]:
+    """(dx, dy) offsets of the tiles a player with this vision can see, in display order"""
+    return tuple(
+        (x, y)
+        for x in range(-vision, vision + 1)
+        for y in range(-vision + x, vision - x + 1)
+    )
+
+@lru_cache(maxsize=1)
+def _tile_cache(path: str) -> TileCache:
+    """One tile cache connection per process"""
+    return TileCache(path)
+
 class Game(Savable):
     players: dict[str,Player]
     dm: DungeonMaster
-    tiles: dict[tuple[int,int],Tile]
+    tiles: TileGrid
     current_turn_number: int
     world_size: int
     # Decomposed verdict components
@@ -38,8 +56,36 @@ class Game(Savable):
     condition_manager: GameConditionManager
     is_game_over: bool
     game_over_reason: str | None
+    # Game metadata persisted as the GameModel row
+    game_id: str
+    name: str
+    description: str
+    status: GameStatus
+    model: str
+    winner_player_name: str | None
+    currency_target: int | None
+    max_turns: int | None
+    total_players: int | None
+    game_duration: str | None
+    # Player-facing tile payloads, kept across turns and dropped for tiles handle_verdict changes
+    _tile_payload_cache: dict[tuple[int,int], dict]
+    _view_payload_cache: dict[tuple[tuple[int,int],int], list[dict]]
+    # DungeonMasterModel snapshot reused by save() while dm.model is unchanged
+    _cached_dm_model: DungeonMasterModel | None
+    _cached_dm_model_sig: str | None
+    # Delta turns: tiles created/changed since the last full snapshot turn (see save)
+    _dirty_tile_keys: set[tuple[int,int]]
+    _snapshot_turn_id: int | None
+    _snapshot_turn_number: int | None
+    # TileModels from earlier saves, rebuilt only for tiles flagged _dirty
+    _tile_model_cache: dict[tuple[int,int], TileModel]
+    # Dump of the GameModel last written by save(), so unchanged metadata isn't rewritten every turn.
+    # A dump rather than the model: storage adapters fill RowModel's private row cache, which model == compares
+    _saved_game_dump: dict | None
 
     def __init__(self, player_info:dict[str,dict], dm_info:dict | None = None, world_size: int | None = None, verbose_level: int = 0):
+        # Chat sessions are process-wide; drop any left over from an earlier game.
+        # Nothing below talks to the AI, so no reset is needed after setup.
         AIWrapper.reset("DungeonMaster")
         self.dm = DungeonMaster()
         self.dm.load(dm_info if dm_info is not None else {})
@@ -58,6 +104,16 @@ class Game(Savable):
         self.is_game_over = False
         self.status = GameStatus.ACTIVE
         self.game_over_reason = None
+        # Game metadata; callers such as gameInitializer overwrite these, Game.load sets them all
+        self.game_id = str(uuid.uuid4())
+        self.name = "Untitled Game"
+        self.description = ""
+        self.model = "mock"
+        self.winner_player_name = None
+        self.currency_target = None
+        self.max_turns = None
+        self.total_players = None
+        self.game_duration = None
         # Add default conditions
         self.condition_manager.add_condition(MaxTurnsCondition())
         self.condition_manager.add_condition(AllPlayersDeadCondition())
@@ -73,72 +129,153 @@ class Game(Savable):
                 p.UID = uid
             self.players[uid] = p
         
-        self._generate_initial_tiles()
-
-        # Reset all AI histories after initialization to ensure clean state
-        AIWrapper.reset("DungeonMaster")
-        for uid in self.players.keys():
-            AIWrapper.reset(uid)
-
-    def _generate_initial_tiles(self):
+        # Tiles are generated on first sight (get_tile / get_viewable_tiles); see prewarm_tiles
+        self.tiles = TileGrid(self.world_size)
+        self._tile_payload_cache = {}
+        self._view_payload_cache = {}
+        self._cached_dm_model = None
+        self._cached_dm_model_sig = None
+        self._dirty_tile_keys = set()
+        self._snapshot_turn_id = None
+        self._snapshot_turn_number = None
+        self._tile_model_cache = {}
+        self._saved_game_dump = None
+
+    def prewarm_tiles(self, radius: int | None = None, use_batch_api: bool = False, batch_api_timeout: float = BATCH_TIMEOUT_SECONDS) -> None:
+        """
+        Generate the missing tiles within radius (default: player vision) of every player
+        in one batched pass, so the first turn doesn't generate them round by round.
+        use_batch_api sends them through the provider's Batch API instead: half the cost,
+        but it blocks until the batch finishes, which can take hours. After batch_api_timeout
+        seconds the batch is cancelled and its unfinished tiles use regular requests.
+        """
+        radius = GameConfig.player_vision if radius is None else radius
         positions = [
-            (i, j)
-            for i in range(-self.world_size, self.world_size + 1)
-            for j in range(-self.world_size, self.world_size + 1)
+            (player.position[0] + dx, player.position[1] + dy)
+            for player in self.players.values()
+            for dx, dy in _vision_offsets(radius)
         ]
+        self._generate_missing_tiles(positions, use_batch_api=use_batch_api, batch_api_timeout=batch_api_timeout)
+
+    def _generate_missing_tiles(self, positions: list[tuple[int, int]], use_batch_api: bool = False, batch_api_timeout: float = BATCH_TIMEOUT_SECONDS) -> None:
+        missing = list(dict.fromkeys(
+            pos for pos in positions
+            if pos not in self.tiles and abs(pos[0]) <= self.world_size and abs(pos[1]) <= self.world_size
+        ))
+        missing = self._load_cached_tiles(missing)
+        if not missing:
+            return
+        if use_batch_api:
+            for position, tile in zip(missing, self.dm.generate_tiles_via_batch_api(missing, timeout=batch_api_timeout)):
+                self.tiles[position] = tile
+            self._mark_tiles_dirty(missing)
+            self._store_cached_tiles(missing)
+        else:
+            self._generate_tiles(missing)
+
+    def _load_cached_tiles(self, positions: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """
+        Fill positions from the on-disk tile cache, for seeded worlds only (GameConfig.world_seed).
+        Returns the positions that still need generating.
+        """
+        if GameConfig.world_seed is None or not positions:
+            return positions
+        try:
+            cached = _tile_cache(GameConfig.tile_cache_file).get_many(GameConfig.world_seed, GameConfig.tile_version, positions)
+        except sqlite3.Error as e:
+            print(f"Warning: Tile cache unavailable, generating tiles: {e}")
+            return positions
+        for position, data in cached.items():
+            self.tiles[position] = Tile.from_dict(data)
+        self._mark_tiles_dirty(cached)
+        return [pos for pos in positions if pos not in cached]
+
+    def _store_cached_tiles(self, positions: list[tuple[int, int]]) -> None:
+        """Write freshly generated tiles to the on-disk tile cache, for seeded worlds only"""
+        if GameConfig.world_seed is None or not positions:
+            return
+        try:
+            _tile_cache(GameConfig.tile_cache_file).put_many(
+                GameConfig.world_seed, GameConfig.tile_version,
+                {pos: self.tiles[pos].save() for pos in positions},
+            )
+        except sqlite3.Error as e:
+            print(f"Warning: Could not write tiles to the tile cache: {e}")
 
-        def _create_tile(position: tuple[int, int]) -> tuple[tuple[int, int], Tile]:
-            session_id = f"DungeonMaster_tile_{position[0]}_{position[1]}_{uuid.uuid4().hex}"
-            tile = self.dm.generate_tile(position, session_id=session_id)
+    def _generate_tiles(self, positions: list[tuple[int, int]]) -> None:
+        """
+        Generate tiles for the given positions, GameConfig.tile_batch_size per AI call,
+        running at most GameConfig.max_concurrency calls at a time.
+        Seeded worlds generate one tile per call, since only those requests carry the tile's seed.
+        """
+        batch_size = 1 if GameConfig.world_seed is not None else max(1, GameConfig.tile_batch_size)
+        batches = [positions[start:start + batch_size] for start in range(0, len(positions), batch_size)]
+
+        def _create_tiles(batch: list[tuple[int, int]]) -> list[tuple[tuple[int, int], Tile]]:
+            session_id = f"DungeonMaster_tile_{batch[0][0]}_{batch[0][1]}_{uuid.uuid4().hex}"
+            if len(batch) == 1:
+                tiles = [self.dm.generate_tile(batch[0], session_id=session_id)]
+            else:
+                tiles = self.dm.generate_tiles_batch(batch, session_id=session_id)
             AIWrapper.reset(session_id)
-            return position, tile
+            return list(zip(batch, tiles))
 
-        max_workers = min(32, len(positions)) or 1
-        self.tiles = {}
+        max_workers = min(GameConfig.max_concurrency, len(batches)) or 1
         if max_workers == 1:
-            for pos in positions:
-                position, tile = _create_tile(pos)
-                self.tiles[position] = tile
+            for batch in batches:
+                for position, tile in _create_tiles(batch):
+                    self.tiles[position] = tile
         else:
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = [executor.submit(_create_tile, pos) for pos in positions]
+                futures = [executor.submit(_create_tiles, batch) for batch in batches]
                 for future in futures:
-                    position, tile = future.result()
-                    self.tiles[position] = tile
+                    for position, tile in future.result():
+                        self.tiles[position] = tile
+        self._mark_tiles_dirty(positions)
+        self._store_cached_tiles(positions)
+
+    def _mark_tiles_dirty(self, positions) -> None:
+        """Remember tiles to write in the next delta turn"""
+        self._dirty_tile_keys.update(positions)
 
     def step(self):
+        """Run one turn. Blocking wrapper around astep for thread/worker callers."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.astep())
+        # Already inside an event loop on this thread: run the turn on its own loop elsewhere
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.astep()).result()
+
+    async def astep(self):
         # Check if game is already over
         if self.is_game_over:
             print(f"[Game] Game is already over: {self.game_over_reason}")
             return
         
-        player_responses, verdict = {}, ""
         negotiation_history: list[dict[str,str]] = []
         sorted_uids = sorted(self.players.keys())
+        # Generate what every player can see in one batched pass; positions don't change
+        # until handle_verdict, so the contexts below only read cached tiles and payloads.
+        # Generation and the tile cache block, so they run on a worker thread like asave
+        await asyncio.to_thread(self.prewarm_tiles)
         print(f"narrative: {self.verdict_narrative_result}")
-        
-        # Negotiation phase: players discuss before committing to actions
+        # Negotiation phase: players discuss before committing to actions.
+        # Within a round players are independent, so their calls run concurrently.
         for negotiation_round in range(GameConfig.num_negotiation_rounds):
-            negotiation_messages = {
-                UID: self.players[UID].get_negotiation_message(
-                    self._build_player_context(UID, sorted_uids, negotiation_history)
-                )
-                for UID in sorted_uids
-            }
+            contexts = self._build_player_contexts(sorted_uids, negotiation_history)
+            negotiation_messages = await self._aask_players(sorted_uids, contexts, negotiation=True)
             negotiation_history.append(negotiation_messages)
             print(f"negotiation_round_{negotiation_round + 1}: {negotiation_messages}")
         
         # Action phase: players commit to final actions after negotiation
-        player_responses = {
-            UID: self.players[UID].get_action(
-                self._build_player_context(UID, sorted_uids, negotiation_history)
-            )
-            for UID in sorted_uids
-        }
+        contexts = self._build_player_contexts(sorted_uids, negotiation_history)
+        player_responses = await self._aask_players(sorted_uids, contexts, negotiation=False)
         print(f"final_actions: {player_responses}")
         
-        verdict = self.dm.respond_actions({"Players": {UID: self.players[UID].save() for UID in sorted_uids},"Responses": player_responses, "Past Verdict Narrative": self.verdict_narrative_result, "tiles": self._get_tiles_full_payload()})    
-        self.handle_verdict(verdict)
+        verdict = await self.dm.arespond_actions({"Players": {UID: self.players[UID].to_dict() for UID in sorted_uids},"Responses": player_responses, "Past Verdict Narrative": self.verdict_narrative_result, "tiles": self._get_tiles_full_payload()})    
+        await self.ahandle_verdict(verdict)
         self.current_turn_number += 1
         
         # Check win/end conditions after processing the turn
@@ -152,7 +289,45 @@ class Game(Savable):
             print(f"  {uid}: health={player.values.health}, wealth={player.values.money}, "
                   f"inventory=[{inventory_str}], position={player.position}")
         
-        self.save()  # Save state after each turn
+        await self.asave()  # Save state after each turn
+    async def _aask_players(self, sorted_uids: list[str], contexts: dict[str, dict], negotiation: bool) -> dict[str, str]:
+        """
+        Collect one negotiation message or action per player for this round.
+        Players are asked concurrently; with GameConfig.batch_player_prompts, living
+        non-A2A players that share a model are answered by one batched request instead.
+        """
+        players = {UID: self.players[UID] for UID in sorted_uids}
+        # Dead players answer with a fixed message, so no request (or coroutine) is scheduled for them
+        results: dict[str, str] = {
+            UID: DEAD_PLAYER_RESPONSE for UID, player in players.items() if player.is_dead()
+        }
+
+        batchable = [
+            UID for UID, player in players.items()
+            if UID not in results and not player.uses_a2a()
+        ] if GameConfig.batch_player_prompts else []
+        if len(batchable) > 1 and len({players[UID].model for UID in batchable}) == 1:
+            prompts = [
+                players[UID].negotiation_request(contexts[UID]) if negotiation else players[UID].action_request(contexts[UID])
+                for UID in batchable
+            ]
+            replies = await asyncio.to_thread(
+                AIWrapper.ask_batch, prompts, batchable, players[batchable[0]].model
+            )
+            for UID, reply in zip(batchable, replies):
+                if reply is not None:
+                    player = players[UID]
+                    results[UID] = player.record_negotiation_message(reply) if negotiation else player.record_action(reply)
+
+        # Everyone not answered by a batch (A2A, mixed models, or skipped by the model)
+        pending = [UID for UID in sorted_uids if UID not in results]
+        answers = await asyncio.gather(*(
+            players[UID].aget_negotiation_message(contexts[UID]) if negotiation else players[UID].aget_action(contexts[UID])
+            for UID in pending
+        ))
+        results.update(zip(pending, answers))
+        return {UID: results[UID] for UID in sorted_uids}
+
     def _check_game_conditions(self) -> None:
         """Check all game end/win conditions and update game state accordingly."""
         result = self.condition_manager.check_conditions(self)
@@ -188,33 +363,65 @@ class Game(Savable):
         """Plain-Python view of a tile for prompts/serialization."""
         return tile.to_dict() #Prevents player from seeing secrets
     
+    async def asave(self) -> str:
+        """
+        save() for async callers: building thousands of tile models and writing them
+        to storage runs on a worker thread, so the event loop keeps serving requests.
+        The game must not be stepped while this is in flight.
+        """
+        return await asyncio.to_thread(self.save)
+
     @override
     def save(self) -> str:
-        # Convert players to PlayerModel format
+        # Convert players to PlayerModel format.
+        # Player.to_dict() already validated this data, so the models are built without re-validating.
         players_data = {}
         for uid, player in self.players.items():
-            player_data = Savable.fromJSON(player.save())
-            players_data[uid] = PlayerModel(**player_data)
+            player_data = player.to_dict()
+            player_data["values"] = PlayerValuesModel.model_construct(**player_data["values"])
+            players_data[uid] = PlayerModel.model_construct(**player_data)
         
-        # Convert DM to DungeonMasterModel format
-        dm_data = Savable.fromJSON(self.dm.save())
-        dm_model = DungeonMasterModel(**dm_data)
+        # Convert DM to DungeonMasterModel format, rebuilt only when the DM's model changes
+        dm_sig = self.dm.model
+        dm_model = self._cached_dm_model
+        if dm_model is None or self._cached_dm_model_sig != dm_sig:
+            dm_model = DungeonMasterModel.model_construct(**self.dm.to_dict())
+            self._cached_dm_model = dm_model
+            self._cached_dm_model_sig = dm_sig
         
-        # Convert tiles to TileModel format
+        # Full snapshot every GameConfig.full_snapshot_interval turns. Turns in between only
+        # store the tiles created or changed since then; turnService rebuilds the full state on read.
+        snapshot_turn_id = self._snapshot_turn_id
+        snapshot_turn_number = self._snapshot_turn_number
+        full_snapshot = (
+            snapshot_turn_id is None
+            or snapshot_turn_number is None
+            or self.current_turn_number - snapshot_turn_number >= max(1, GameConfig.full_snapshot_interval)
+        )
+        if full_snapshot:
+            tile_items = self.tiles.items()
+        else:
+            tile_items = [(key, self.tiles[key]) for key in sorted(self._dirty_tile_keys) if key in self.tiles]
+
+        # Convert tiles to TileModel format (tiles are internal state, so skip validation).
+        # Unchanged tiles reuse the TileModel built by an earlier save.
+        tile_model_cache = self._tile_model_cache
         tiles_data = []
-        for (x, y), val in self.tiles.items():
+        for (x, y), val in tile_items:
             tile = val[0] if isinstance(val, tuple) else val  # handle (Tile, ...) cases
-            # Convert Secret objects to dicts for TileModel
-            secrets = [secret.to_dict() for secret in tile.secrets]
-            tiles_data.append(
-                TileModel(
-                    position=[int(x), int(y)],
+            key = (int(x), int(y))
+            tile_model = tile_model_cache.get(key)
+            if tile_model is None or getattr(tile, "_dirty", True):
+                tile_model = TileModel.model_construct(
+                    position=[key[0], key[1]],
                     description=getattr(tile, "description", ""),
-                    secrets=secrets,
+                    secrets=[SecretKV.model_construct(key=secret.key, value=secret.value) for secret in tile.secrets],
                     terrainType=getattr(tile, "terrainType", "plains"),
                     terrainEmoji=getattr(tile, "terrainEmoji", "🌾"),
                 )
-            )
+                tile_model_cache[key] = tile_model
+                tile._dirty = False
+            tiles_data.append(tile_model)
         
         # Create game state for this turn
         game_state = GameStateModel(
@@ -230,33 +437,32 @@ class Game(Savable):
             narrative_result=self.verdict_narrative_result,
             # Include game over state
             is_game_over=self.is_game_over,
-            game_over_reason=self.game_over_reason
+            game_over_reason=self.game_over_reason,
+            snapshot_turn_id=None if full_snapshot else snapshot_turn_id
         )
         
         # Create/update game metadata (without game_state)
-        game_id = getattr(self, 'game_id', str(uuid.uuid4()))
-        # Determine status based on game_over state
-        if self.is_game_over:
-            status = getattr(self, 'status', GameStatus.COMPLETED)
-        else:
-            status = getattr(self, 'status', GameStatus.ACTIVE)
-        
+        game_id = self.game_id
         game_data = GameModel(
             id=game_id,
-            name=getattr(self, 'name', 'Untitled Game'),
-            description=getattr(self, 'description', ''),
-            status=status,
-            model=getattr(self, 'model', 'mock'),
+            name=self.name,
+            description=self.description,
+            status=self.status,
+            model=self.model,
             world_size=self.world_size,
-            winner_player_name=getattr(self, 'winner_player_name', None),
-            currency_target=getattr(self, 'currency_target', None),
-            max_turns=getattr(self, 'max_turns', None),
-            total_players=getattr(self, 'total_players', None),
-            game_duration=getattr(self, 'game_duration', None)
+            winner_player_name=self.winner_player_name,
+            currency_target=self.currency_target,
+            max_turns=self.max_turns,
+            total_players=self.total_players,
+            game_duration=self.game_duration
         )
         
-        # Save game metadata to database
-        saved_id = save_game_to_database(game_data)
+        # Save game metadata to database; it rarely changes between turns, and skipping
+        # the unchanged row leaves one storage round trip (the turn) per save
+        game_dump = game_data.model_dump()
+        if game_dump != self._saved_game_dump:
+            save_game_to_database(game_data)
+            self._saved_game_dump = game_dump
         
         # Create turn model with game state
         turn_data = TurnModel(
@@ -267,6 +473,10 @@ class Game(Savable):
         
         # Save turn to database
         turn_id = save_turn_to_database(turn_data)
+        if full_snapshot:
+            self._snapshot_turn_id = turn_id
+            self._snapshot_turn_number = self.current_turn_number
+            self._dirty_tile_keys = set()
         
         # Return JSON string for compatibility (include turn info)
         result = game_data.model_dump()
@@ -279,12 +489,15 @@ class Game(Savable):
         # If game_id is provided, load from database using lib function
         if game_id:
             try:
-                # Load game metadata
-                game_model = load_game_from_database(game_id)
-                
-                # Load latest turn to get game state
+                # Game metadata and latest turn are independent reads, so fetch them together
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    game_future = executor.submit(load_game_from_database, game_id)
+                    turn_future = executor.submit(get_latest_turn_by_game_id, game_id)
+                game_model = game_future.result()
+
+                # Latest turn carries the game state
                 try:
-                    latest_turn = get_latest_turn_by_game_id(game_id)
+                    latest_turn = turn_future.result()
                     game_state = latest_turn.game_state
                     self.current_turn_number = latest_turn.turn_number
                 except ValueError:
@@ -349,9 +562,11 @@ class Game(Savable):
         self.dm = DungeonMaster()
         dm_data = game_state.dm.model_dump() if hasattr(game_state.dm, 'model_dump') else game_state.dm
         self.dm.load(dm_data)
+        self._cached_dm_model = None
+        self._cached_dm_model_sig = None
 
         # Load tiles
-        tiles_map: dict[tuple[int, int], Tile] = {}
+        tiles_map = TileGrid(getattr(game_model, 'world_size', GameConfig.world_size))
         for tile_data in game_state.tiles:
             if hasattr(tile_data, 'model_dump'):
                 tile_dict = tile_data.model_dump()
@@ -359,8 +574,19 @@ class Game(Savable):
                 tile_dict = tile_data
             
             t = Tile.from_dict(tile_dict)
-            tiles_map[(t.position[0], t.position[1])] = t
+            try:
+                tiles_map[(t.position[0], t.position[1])] = t
+            except KeyError:
+                print(f"Warning: Skipping tile outside the world at {t.position}")
         self.tiles = tiles_map
+        self._tile_payload_cache = {}
+        self._view_payload_cache = {}
+        # Changes since the loaded turn's snapshot aren't known, so the next save is a full snapshot
+        self._dirty_tile_keys = set()
+        self._snapshot_turn_id = None
+        self._snapshot_turn_number = None
+        self._tile_model_cache = {}
+        self._saved_game_dump = None
         
         # Store game metadata
         self.game_id = game_model.id
@@ -385,23 +611,58 @@ class Game(Savable):
         self.condition_manager.add_condition(AllPlayersDeadCondition())
         self.condition_manager.add_condition(CurrencyGoalCondition())
 
+    @staticmethod
+    def _viewable_positions(position:tuple[int,int], vision:int = 1) -> list[tuple[int,int]]:
+        x, y = position
+        return [(x+dx, y+dy) for dx, dy in _vision_offsets(vision)]
+
     def get_viewable_tiles(self,position:tuple[int,int], vision:int = 1) -> list[Tile]:
-        tiles = []
-        for x in range(-vision,vision+1):
-            for y in range(-vision+x,vision-x+1):
-                tiles.append(self.get_tile((position[0]+x,position[1]+y)))
-        return tiles
+        positions = self._viewable_positions(position, vision)
+        # Generate every missing in-bounds tile in one concurrent batch rather than one at a time
+        self._generate_missing_tiles(positions)
+        return [self.get_tile(pos) for pos in positions]
     
     def _get_viewable_tiles_payload(self,position:tuple[int,int], vision:int = 1) -> list[dict]:
-        return [self._tile_payload(t) for t in self.get_viewable_tiles(position, vision)]
+        # Reuse the payload for players on the same tile, across rounds and across turns
+        # until handle_verdict changes one of the tiles in view (see _invalidate_tile_payloads)
+        view_cache = self._view_payload_cache
+        key = (tuple(position), vision)
+        if key in view_cache:
+            return view_cache[key]
+        tile_cache = self._tile_payload_cache
+        payload = []
+        for t in self.get_viewable_tiles(position, vision):
+            tile_key = tuple(t.position)
+            if tile_key not in tile_cache:
+                tile_cache[tile_key] = self._tile_payload(t)
+            payload.append(tile_cache[tile_key])
+        view_cache[key] = payload
+        return payload
     
+    def _invalidate_tile_payloads(self, dirty_tiles: set[tuple[int,int]]) -> None:
+        """Drop cached payloads for changed tiles and every cached view that contains one"""
+        if not dirty_tiles:
+            return
+        tile_cache = self._tile_payload_cache
+        for key in dirty_tiles:
+            tile_cache.pop(key, None)
+        view_cache = self._view_payload_cache
+        if view_cache:
+            for view_key in [
+                (position, vision) for position, vision in view_cache
+                if not dirty_tiles.isdisjoint(self._viewable_positions(position, vision))
+            ]:
+                del view_cache[view_key]
+
     def _get_tiles_full_payload(self) -> list[dict]:
         return [self._full_tile_payload(t) for t in self.tiles.values()]
 
-    def _build_player_context(self, uid: str, sorted_uids: list[str], negotiation_history: list[dict[str,str]]) -> dict:
-        """Build sanitized context for a player request."""
-        player = self.players[uid]
-        tiles_payload = self._get_viewable_tiles_payload(player.position, GameConfig.player_vision)
+    def _build_player_contexts(self, sorted_uids: list[str], negotiation_history: list[dict[str,str]]) -> dict[str, dict]:
+        """
+        Build sanitized contexts for every player's request this round. Open contexts and
+        the negotiation history are the same for everyone, so they are built once and shared.
+        """
+        open_contexts = {uid: self.players[uid].get_open_context() for uid in sorted_uids}
         
         # Format negotiation history as a list of messages per round
         formatted_negotiation_history = []
@@ -409,13 +670,21 @@ class Game(Savable):
             formatted_round = [round_messages[other_uid] for other_uid in sorted_uids]
             formatted_negotiation_history.append(formatted_round)
         
+        return {
+            uid: self._build_player_context(uid, open_contexts, formatted_negotiation_history)
+            for uid in sorted_uids
+        }
+
+    def _build_player_context(self, uid: str, open_contexts: dict[str, dict], formatted_negotiation_history: list[list[str]]) -> dict:
+        """Build sanitized context for a player request."""
+        player = self.players[uid]
+        tiles_payload = self._get_viewable_tiles_payload(player.position, GameConfig.player_vision)
+        
+        others = dict(open_contexts)
+        del others[uid]
         context = {
-            "Self": player.get_open_context(),
-            "Players (excluding self)": {
-                other_uid: self.players[other_uid].get_open_context()
-                for other_uid in sorted_uids
-                if other_uid != uid
-            },
+            "Self": open_contexts[uid],
+            "Players (excluding self)": others,
             "tiles": tiles_payload,
             "uid": uid,
             "position": player.position,
@@ -426,114 +695,100 @@ class Game(Savable):
     def _get_responses_at_frame(self, frame:int) -> dict[str,str]:
         responses = {}
         for uid, player in self.players.items():
-            hist = player.get_responses_history()
-            if hist and len(hist) > frame:
-                responses[uid] = hist[frame]
-        if self.dm._responses and len(self.dm._responses) > frame:
-            responses["DM"] = self.dm._responses[frame]
+            response = player.get_response_at(frame)
+            if response is not None:
+                responses[uid] = response
+        dm_response = self.dm.get_response_at(frame)
+        if dm_response is not None:
+            responses["DM"] = dm_response
         return responses
     
-    def handle_verdict(self, verdict: GameResponse | dict | str | None):
-        """
-        Apply a DM verdict to game state.
-        - Accepts GameResponse (pydantic), dict-like, or JSON string.
-        - Supports multiple players via CharacterState entries keyed by uid.
-        - Ignores/records unknown or false UIDs without raising.
-        - Clamps negative money/health to 0.
-        - Applies world_state_change tile updates when present.
-        """
+    @staticmethod
+    def _parse_verdict(verdict: GameResponse | dict | str | None) -> GameResponse | None:
+        """Coerce a verdict into a GameResponse; None when there is nothing to apply"""
         if verdict is None:
-            return
-
-        # --- Coerce input into a GameResponse safely (pydantic v1/v2 compatible) ---
-        def _pyd_parse_dict(model_cls, data: dict):
-            # v2: model_validate, v1: parse_obj
-            if hasattr(model_cls, "model_validate"):
-                return model_cls.model_validate(data)  # pydantic v2
-            return model_cls.parse_obj(data)          # pydantic v1
-
-        def _pyd_parse_json(model_cls, data: str):
-            # v2: model_validate_json, v1: parse_raw
-            if hasattr(model_cls, "model_validate_json"):
-                return model_cls.model_validate_json(data)  # pydantic v2
-            return model_cls.parse_raw(data)                # pydantic v1
-
+            return None
         parsed: GameResponse | None = None
         try:
             if isinstance(verdict, GameResponse):
                 parsed = verdict
             elif isinstance(verdict, dict):
-                parsed = _pyd_parse_dict(GameResponse, verdict)
+                parsed = GameResponse.model_validate(verdict)
         except Exception as E:
             raise ValueError(f"Failed to parse verdict into GameResponse: {E}.")
 
         if parsed is None or not isinstance(getattr(parsed, "character_state_change", None), list):
-            return #Don't throw errors if state is empty
+            return None #Don't throw errors if state is empty
+        return parsed
+
+    async def ahandle_verdict(self, verdict: GameResponse | dict | str | None):
+        """handle_verdict for async callers: validation runs on a worker thread, the state changes on the loop"""
+        parsed = await asyncio.to_thread(self._parse_verdict, verdict)
+        if parsed is not None:
+            self._apply_verdict(parsed)
+
+    def handle_verdict(self, verdict: GameResponse | dict | str | None):
+        """
+        Apply a DM verdict to game state.
+        - Accepts GameResponse (pydantic), dict-like, or JSON string.
+        - Supports multiple players via CharacterState entries keyed by uid.
+        - Ignores/records unknown or false UIDs without raising.
+        - Clamps negative money/health to 0.
+        - Applies world_state_change tile updates when present.
+        """
+        parsed = self._parse_verdict(verdict)
+        if parsed is not None:
+            self._apply_verdict(parsed)
+
+    def _apply_verdict(self, parsed: GameResponse):
+        """Apply a parsed verdict to players and tiles, and keep its components for persistence"""
 
         # --- Apply per-player character updates ---
-        unknown_uids: list[str] = []
+        unknown_uids: set[str] = set()
         level_up_events: dict[str, list[str]] = {}
 
         for cs in parsed.character_state_change:
             try:
                 if not isinstance(cs, CharacterState):
-                    cs = _pyd_parse_dict(CharacterState, cs if isinstance(cs, dict) else cs.__dict__)
+                    cs = CharacterState.model_validate(cs if isinstance(cs, dict) else cs.__dict__)
             except Exception:
                 continue
 
-            uid = getattr(cs, "uid", None)
+            # From here on cs is a validated CharacterState, so every field is present
+            uid = cs.uid
             if not uid or uid == "INVALID":
                 print(f"[handle_verdict] Ignored CharacterState with missing/invalid UID: {cs}")
                 continue
 
             player = self.players.get(uid)
             if player is None:
-                unknown_uids.append(uid)
+                unknown_uids.add(uid)
                 continue
 
-            try:
-                pos_raw = list(getattr(cs, "position_change", []))
-                if len(pos_raw) >= 2:
-                    new_pos = (int(pos_raw[0]), int(pos_raw[1]))
-                else:
-                    new_pos = (0,0)
-            except Exception:
-                new_pos = (0,0)
-
-            try:
-                money = getattr(cs, "money_change", 0)
-            except Exception:
-                money = 0
-
-            try:
-                health = getattr(cs, "health_change", 0)
-            except Exception:
-                health = 0
+            pos_raw = cs.position_change
+            new_pos = (pos_raw[0], pos_raw[1]) if len(pos_raw) >= 2 else (0,0)
 
-            player.update_position(new_pos)
-            player.values.update_money(money)
-            player.values.update_health(health)
-            xp_gain = getattr(cs, "experience_change", 0)
+            player.update_position(new_pos, self.world_size)
+            player.values.apply_delta(cs.money_change, cs.health_change)
+            xp_gain = cs.experience_change
             if xp_gain != 0:
                 player.experience += xp_gain
                 print(f"[handle_verdict] Player {uid} gained {xp_gain} XP (total: {player.experience})")
 
-            resource_changes = getattr(cs, "resource_changes", {})
+            resource_changes = cs.resource_changes
             if resource_changes:
                 player.update_resources(resource_changes)
 
-            cooldowns = getattr(cs, "skill_cooldowns", {})
-            for skill_name, turns in cooldowns.items():
+            for skill_name, turns in cs.skill_cooldowns.items():
                 player.set_cooldown(skill_name, turns)
 
             player.update_cooldowns(turn_delta=0)
 
             player.total_action_count += 1
-            action_was_invalid = getattr(cs, "action_was_invalid", False)
-            if action_was_invalid:
+            if cs.action_was_invalid:
                 player.invalid_action_count += 1
 
-            new_unlocks_from_dm = getattr(cs, "new_unlocks", [])
+            new_unlocks_from_dm = cs.new_unlocks
 
             new_unlocks_from_level = player.check_level_up()
             if new_unlocks_from_level:
@@ -544,44 +799,44 @@ class Game(Savable):
                 for skill in new_unlocks_from_dm:
                     player.unlock_skill(skill)
             # Inventory changes (process add first, then remove)
-            try:
-                inventory_add = getattr(cs, "inventory_add", None)
-                if inventory_add is not None and isinstance(inventory_add, list):
-                    player.values.add_inventory(inventory_add)
-            except Exception as e:
-                print(f"[handle_verdict] Error processing inventory_add for {uid}: {e}")
-
-            try:
-                inventory_remove = getattr(cs, "inventory_remove", None)
-                if inventory_remove is not None and isinstance(inventory_remove, list):
-                    player.values.remove_inventory(inventory_remove)
-            except Exception as e:
-                print(f"[handle_verdict] Error processing inventory_remove for {uid}: {e}")
+            if cs.inventory_add:
+                player.values.add_inventory(cs.inventory_add)
+            if cs.inventory_remove:
+                player.values.remove_inventory(cs.inventory_remove)
 
         if unknown_uids:
-            print(f"[handle_verdict] Ignored unknown UIDs: {sorted(set(unknown_uids))}")
+            print(f"[handle_verdict] Ignored unknown UIDs: {sorted(unknown_uids)}")
 
         # --- Apply world updates to tiles if provided ---
         ws = getattr(parsed, "world_state_change", None)
         tiles_payload = getattr(ws, "tiles", None) if ws else None
         if tiles_payload:
+            # Normalize the payload up front (TileState models dump their SecretKV secrets as dicts),
+            # then apply it in a plain loop
+            tile_updates: list[tuple[tuple[int,int], str, list[tuple[str,int]]]] = []
             for td in tiles_payload:
+                if not isinstance(td, dict):
+                    td = td.model_dump() if hasattr(td, "model_dump") else vars(td)
                 try:
-                    if isinstance(td, dict):
-                        pos = list(td["position"])
-                        desc = td.get("description", "")
-                        secrets = [(str(k), int(v)) for k, v in td.get("secrets", [])]
-                    else:
-                        pos = list(getattr(td, "position"))
-                        desc = getattr(td, "description", "")
-                        secrets = [(str(k), int(v)) for k, v in getattr(td, "secrets", [])]
-
-                    key = (int(pos[0]), int(pos[1]))
-                    t = self.tiles[key]
-                    t.update_description(desc)
-                    t.update_secrets(secrets)
-                except Exception:
+                    pos = td["position"]
+                    secrets = [
+                        (str(sec["key"]), int(sec["value"])) if isinstance(sec, dict) else (str(sec[0]), int(sec[1]))
+                        for sec in td.get("secrets") or []
+                    ]
+                    tile_updates.append(((int(pos[0]), int(pos[1])), td.get("description", ""), secrets))
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    print(f"Warning: Skipping malformed tile update {td}: {e}")
+
+            dirty_tiles: set[tuple[int,int]] = set()
+            for key, desc, secrets in tile_updates:
+                t = self.tiles.get(key)
+                if t is None:
                     continue
+                t.update_description(desc)
+                t.update_secrets(secrets)
+                dirty_tiles.add(key)
+            self._invalidate_tile_payloads(dirty_tiles)
+            self._mark_tiles_dirty(dirty_tiles)
         
         # --- Store decomposed verdict components for persistence ---
         self.verdict_character_state = getattr(parsed, "character_state_change", [])
@@ -593,9 +848,10 @@ class Game(Savable):
         if abs(position[0]) > self.world_size or abs(position[1]) > self.world_size:
             return Tile("This is an invalid tile. You cannot interact with or enter this tile.", position=position)
         if position not in self.tiles:
-            self.tiles[position] = self.dm.generate_tile(position)
+            # Cached or generated in its own throwaway session, so tile prompts never end up in the DM's verdict history
+            self._generate_missing_tiles([tuple(position)])
         return self.tiles[position]
-    def get_all_tiles(self) -> dict[tuple[int,int],Tile]:   
+    def get_all_tiles(self) -> TileGrid:   
         return self.tiles   
     def get_player(self, UID: str) -> Player:   
         return self.players[UID]
@@ -608,8 +864,8 @@ class Game(Savable):
         return {
             'is_game_over': self.is_game_over,
             'game_over_reason': self.game_over_reason,
-            'status': getattr(self, 'status', GameStatus.ACTIVE),
+            'status': self.status,
             'current_turn': self.current_turn_number,
-            'max_turns': getattr(self, 'max_turns', None),
-            'winner': getattr(self, 'winner_player_name', None)
+            'max_turns': self.max_turns,
+            'winner': self.winner_player_name
         }
@@ -1,4 +1,9 @@
+import asyncio
+from bisect import bisect_right
+from collections import Counter, deque
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Optional, Dict, List, Any
 from typing_extensions import override
 from database.fileManager import Savable
@@ -9,12 +14,49 @@ from src.services.AiServicesBase import AiServicesBase
 from schema.playerModel import PlayerModel, PlayerValuesModel
 from schema.characterModel import CharacterTemplate, load_character_template, CharacterState as CharState
 
+# Only the most recent actions and negotiation messages are kept (and saved with the player);
+# every turn's action is also stored in that turn's game state
+MAX_RESPONSE_HISTORY = 256
+
+# What a dead player says and does every round; no AI call is made for them
+DEAD_PLAYER_RESPONSE = "This player is dead."
+
+# XP_THRESHOLDS[i] is the experience needed to reach level i + 1 (levels 1-20)
+XP_THRESHOLDS = (
+    0, 300, 900, 2700, 6500, 14000, 23000, 34000, 48000, 64000,
+    85000, 100000, 120000, 140000, 165000, 195000, 225000, 265000, 305000, 355000
+)
+
+ATTRIBUTE_NAMES = ('STR', 'DEX', 'INT', 'WIS', 'CON', 'CHA')
+
+@lru_cache(maxsize=64)
+def _template_attribute_fields(template_name: str) -> dict[str, int]:
+    """
+    Attribute scores and modifiers of a template as player prompt fields (STR, STR_mod, ...).
+    Base attributes never change, so this is built once per template; callers must not mutate it.
+    """
+    attrs = load_character_template(template_name).base_attributes
+    fields = {}
+    for attr in ATTRIBUTE_NAMES:
+        fields[attr] = getattr(attrs, attr)
+        fields[f'{attr}_mod'] = attrs.get_modifier(attr)
+    return fields
+
+@lru_cache(maxsize=64)
+def _augmented_prompt(base_prompt: str, agent_prompt: str) -> str:
+    """Base prompt plus a player's agent-specific instructions; both are fixed for most of a game"""
+    extra = agent_prompt.strip()
+    if extra:
+        return f"{base_prompt}\n\nAgent-specific instructions:\n{extra}"
+    return base_prompt
+
 @dataclass(frozen=True, slots=True)
 class PlayerClass:
     name: str
     description: str
 
 class PlayerValues(Savable):
+    __slots__ = ('money', 'health', 'inventory', 'player')
     money: int
     health: int
     inventory: list[str]
@@ -27,27 +69,43 @@ class PlayerValues(Savable):
         self.player = player
     def update_money(self, change: int):
         self.money = max(self.money+change,0)
-        if self.money < 0:
-            raise ValueError("Money is below zero.")
     def update_health(self, change: int):
         self.health = max(self.health+change,0)
         if self.health <= 0 and self.player:
             self.player.handle_death()
+    def apply_delta(self, money: int, health: int):
+        """Apply a verdict's money and health changes together, both clamped at 0"""
+        money += self.money
+        health += self.health
+        self.money = money if money > 0 else 0
+        self.health = health if health > 0 else 0
+        if self.health == 0 and self.player:
+            self.player.handle_death()
     def add_inventory(self, items: list[str]):
         """Add items to inventory."""
         self.inventory.extend(items)
     def remove_inventory(self, items: list[str]):
         """Remove one instance of each item from inventory. Logs warning if item doesn't exist."""
-        for item in items:
-            try:
-                self.inventory.remove(item)
-            except ValueError:
+        # One pass over the inventory; like list.remove, the earliest copies go first
+        to_remove = Counter(items)
+        kept = []
+        for item in self.inventory:
+            if to_remove[item] > 0:
+                to_remove[item] -= 1
+            else:
+                kept.append(item)
+        self.inventory[:] = kept
+        for item, missing in to_remove.items():
+            for _ in range(missing):
                 print(f"[PlayerValues] Warning: Attempted to remove item '{item}' that doesn't exist in inventory.")
     @override
+    def to_dict(self) -> dict:
+        # Built directly: __init__/load validate and the updates clamp at 0.
+        # The inventory is shared, not copied (see Player.to_dict)
+        return {"money": self.money, "health": self.health, "inventory": self.inventory}
+    @override
     def save(self) -> str:
-        # Create PlayerValuesModel for validation
-        values_model = PlayerValuesModel(money=self.money, health=self.health, inventory=self.inventory)
-        return Savable.toJSON(values_model.model_dump())
+        return Savable.toJSON(self.to_dict())
     
     @override
     def load(self, loaded_data: str | dict):
@@ -58,31 +116,42 @@ class PlayerValues(Savable):
             values_model = PlayerValuesModel(**loaded_data)
             self.money = values_model.money
             self.health = values_model.health
-            self.inventory = getattr(values_model, "inventory", [])
+            self.inventory = values_model.inventory
         except Exception as e:
             raise ValueError(f"Invalid player values data: {str(e)}")
 
-PLAYER_CLASSES = {
+# Read-only: every player shares these PlayerClass instances
+PLAYER_CLASSES = MappingProxyType({
     "human" : PlayerClass("human","A very below average human being.")
-}
+})
 
 class Player(Savable):
+    __slots__ = (
+        'model', 'UID', 'values', 'player_class', 'position', 'agent_prompt',
+        '_responses', '_response_count', '_negotiation_messages',
+        'character_template', 'character_template_name', 'current_abilities', '_ability_set',
+        'resource_pools', '_resource_status', 'skill_cooldowns', 'experience', 'level',
+        'invalid_action_count', 'total_action_count', 'a2a_agent_id', 'tool_provider',
+    )
     model: str
     UID: str
     values: PlayerValues
     player_class: PlayerClass
     position: tuple[int,int]
-    _responses: list[str]
+    _responses: deque[str]
+    _response_count: int
     character_template: Optional[CharacterTemplate]
     character_template_name: Optional[str]  # Store the template name for serialization
     current_abilities: List[str]
+    _ability_set: set[str]  # Same names as current_abilities, for membership checks
     resource_pools: Dict[str, int]
+    _resource_status: Optional[str]  # Prompt text for resource_pools; None until rebuilt after a change
     skill_cooldowns: Dict[str, int]
     experience: int
     level: int
     invalid_action_count: int
     total_action_count: int
-    _negotiation_messages: list[str]
+    _negotiation_messages: deque[str]
     a2a_agent_id: Optional[str]
     tool_provider: Optional[Any]
 
@@ -92,23 +161,27 @@ class Player(Savable):
         self.UID = UID
         self.position = position
         self.agent_prompt: str = ""
-        if player_class not in PLAYER_CLASSES:
+        resolved_class = PLAYER_CLASSES.get(player_class)
+        if resolved_class is None:
             raise ValueError(f"Invalid player class {player_class}")
-        self.player_class = PLAYER_CLASSES[player_class]
+        self.player_class = resolved_class
 
         self.values = PlayerValues(player=self)
-        self._responses = []
+        self._responses = deque(maxlen=MAX_RESPONSE_HISTORY)
+        self._response_count = 0
 
         self.character_template = None
         self.character_template_name = character_template_name  # Store the template name
         self.current_abilities = []
+        self._ability_set = set()
         self.resource_pools = {}
+        self._resource_status = None
         self.skill_cooldowns = {}
         self.experience = 0
         self.level = 1
         self.invalid_action_count = 0
         self.total_action_count = 0
-        self._negotiation_messages = []
+        self._negotiation_messages = deque(maxlen=MAX_RESPONSE_HISTORY)
         self.a2a_agent_id = None
         self.tool_provider = None
 
@@ -116,17 +189,15 @@ class Player(Savable):
             try:
                 self.character_template = load_character_template(character_template_name)
                 self.current_abilities = self.character_template.get_level_1_abilities()
+                self._ability_set = set(self.current_abilities)
                 self.resource_pools = self.character_template.resource_pools.copy()
+                self._resource_status = None
                 for item in self.character_template.starting_equipment:
                     self.values.add_inventory([item])
             except Exception as e:
                 print(f"[Player] Warning: Could not load character template '{character_template_name}': {e}")
     def _augment_prompt(self, base_prompt: str) -> str:
-        if getattr(self, "agent_prompt", ""):
-            extra = self.agent_prompt.strip()
-            if extra:
-                return f"{base_prompt}\n\nAgent-specific instructions:\n{extra}"
-        return base_prompt
+        return _augmented_prompt(base_prompt, self.agent_prompt)
     def is_dead(self) -> bool:
         """Check if the player is dead (health <= 0)."""
         return self.values.health <= 0
@@ -137,65 +208,65 @@ class Player(Savable):
         """
         self.values.money = 0
         print(f"[Player] {self.UID} died at {self.position}.")
+    def negotiation_request(self, context: dict) -> str:
+        """Full prompt for this player's negotiation message."""
+        return format_request(self._augment_prompt(AIConfig.negotiation_prompt), context)
+    def action_request(self, context: dict) -> str:
+        """Full prompt for this player's action, with character data when a template is set."""
+        prompt = self._augment_prompt(AIConfig.player_prompt)
+        if self.character_template:
+            return format_request(prompt, self._enrich_context_with_character_data(context))
+        return format_request(prompt, context)
+    def uses_a2a(self) -> bool:
+        return bool(self.a2a_agent_id and self.tool_provider)
+    def record_negotiation_message(self, message: str) -> str:
+        self._negotiation_messages.append(message)
+        return message
+    def record_action(self, response: str) -> str:
+        self._responses.append(response)
+        self._response_count += 1
+        return response
     def get_negotiation_message(self, context: dict) -> str:
         """Get a negotiation message during the planning phase. This is discussion only, not a final action."""
         if self.is_dead():
-            return "This player is dead."
+            return DEAD_PLAYER_RESPONSE
 
-        # Use A2A if agent_id is set
-        if self.a2a_agent_id and self.tool_provider:
-            import asyncio
-            prompt = self._augment_prompt(AIConfig.negotiation_prompt)
-            formatted_context = format_request(prompt, context)
-            try:
-                loop = asyncio.get_running_loop()
-                # We're in an async context, schedule coroutine in current loop
-                response = asyncio.run_coroutine_threadsafe(
-                    self.tool_provider.talk_to_agent(formatted_context, self.a2a_agent_id, new_conversation=False),
-                    loop
-                ).result()
-            except RuntimeError:
-                # No running loop, create one
-                response = asyncio.run(self.tool_provider.talk_to_agent(formatted_context, self.a2a_agent_id, new_conversation=False))
-        else:
-            prompt = self._augment_prompt(AIConfig.negotiation_prompt)
-            response = AIWrapper.ask(format_request(prompt, context), self.model, self.UID)
-
-        self._negotiation_messages.append(response)
-        return response
+        return self.record_negotiation_message(self._ask(self.negotiation_request(context)))
     def get_action(self,context: dict) -> str:
         if self.is_dead():
-            return "This player is dead."
+            return DEAD_PLAYER_RESPONSE
 
+        return self.record_action(self._ask(self.action_request(context)))
+    def _ask(self, formatted_context: str) -> str:
         # Use A2A if agent_id is set
-        if self.a2a_agent_id and self.tool_provider:
-            import asyncio
-            prompt = self._augment_prompt(AIConfig.player_prompt)
-            if self.character_template:
-                enriched_context = self._enrich_context_with_character_data(context)
-                formatted_context = format_request(prompt, enriched_context)
-            else:
-                formatted_context = format_request(prompt, context)
-            try:
-                loop = asyncio.get_running_loop()
-                # We're in an async context, schedule coroutine in current loop
-                response = asyncio.run_coroutine_threadsafe(
-                    self.tool_provider.talk_to_agent(formatted_context, self.a2a_agent_id, new_conversation=False),
-                    loop
-                ).result()
-            except RuntimeError:
-                # No running loop, create one
-                response = asyncio.run(self.tool_provider.talk_to_agent(formatted_context, self.a2a_agent_id, new_conversation=False))
-        else:
-            prompt = self._augment_prompt(AIConfig.player_prompt)
-            if self.character_template:
-                enriched_context = self._enrich_context_with_character_data(context)
-                response = AIWrapper.ask(format_request(prompt, enriched_context), self.model, self.UID)
-            else:
-                response = AIWrapper.ask(format_request(prompt, context), self.model, self.UID)
-
-        self._responses.append(response)
-        return response
+        if self.uses_a2a():
+            return self._talk_to_agent(formatted_context)
+        return AIWrapper.ask(formatted_context, self.model, self.UID)
+    def _talk_to_agent(self, formatted_context: str) -> str:
+        try:
+            loop = asyncio.get_running_loop()
+            # We're in an async context, schedule coroutine in current loop
+            return asyncio.run_coroutine_threadsafe(
+                self.tool_provider.talk_to_agent(formatted_context, self.a2a_agent_id, new_conversation=False),
+                loop
+            ).result()
+        except RuntimeError:
+            # No running loop, create one
+            return asyncio.run(self.tool_provider.talk_to_agent(formatted_context, self.a2a_agent_id, new_conversation=False))
+    async def _aask(self, formatted_context: str) -> str:
+        if self.uses_a2a():
+            return await self.tool_provider.talk_to_agent(formatted_context, self.a2a_agent_id, new_conversation=False)
+        return await AIWrapper.aask(formatted_context, self.model, self.UID)
+    async def aget_negotiation_message(self, context: dict) -> str:
+        """Async get_negotiation_message, so players in a round can be asked concurrently."""
+        if self.is_dead():
+            return DEAD_PLAYER_RESPONSE
+        return self.record_negotiation_message(await self._aask(self.negotiation_request(context)))
+    async def aget_action(self, context: dict) -> str:
+        """Async get_action, so players in a round can be asked concurrently."""
+        if self.is_dead():
+            return DEAD_PLAYER_RESPONSE
+        return self.record_action(await self._aask(self.action_request(context)))
 
     def _enrich_context_with_character_data(self, context: dict) -> dict:
         if not self.character_template:
@@ -207,21 +278,20 @@ class Player(Savable):
         enriched['character_class'] = self.character_template.character_class
         enriched['current_level'] = self.level
 
-        attrs = self.character_template.base_attributes
-        for attr in ['STR', 'DEX', 'INT', 'WIS', 'CON', 'CHA']:
-            val = getattr(attrs, attr)
-            enriched[attr] = val
-            enriched[f'{attr}_mod'] = attrs.get_modifier(attr)
+        enriched.update(_template_attribute_fields(self.character_template_name))
 
-        resource_lines = []
-        for resource, amount in self.resource_pools.items():
-            resource_lines.append(f"  - {resource}: {amount}")
-        enriched['resource_status'] = '\n'.join(resource_lines) if resource_lines else "  - No special resources"
+        if self._resource_status is None:
+            resource_lines = []
+            for resource, amount in self.resource_pools.items():
+                resource_lines.append(f"  - {resource}: {amount}")
+            self._resource_status = '\n'.join(resource_lines) if resource_lines else "  - No special resources"
+        enriched['resource_status'] = self._resource_status
 
         return enriched
 
     def unlock_skill(self, skill_name: str):
-        if skill_name not in self.current_abilities:
+        if skill_name not in self._ability_set:
+            self._ability_set.add(skill_name)
             self.current_abilities.append(skill_name)
             print(f"[Player {self.UID}] Unlocked skill: {skill_name}")
 
@@ -229,39 +299,37 @@ class Player(Savable):
         if not self.character_template:
             return None
 
-        XP_THRESHOLDS = [
-            0, 300, 900, 2700, 6500, 14000, 23000, 34000, 48000, 64000,
-            85000, 100000, 120000, 140000, 165000, 195000, 225000, 265000, 305000, 355000
-        ]
-
-        if self.level >= 20:
+        # A large XP gain can cross several thresholds at once
+        new_level = bisect_right(XP_THRESHOLDS, self.experience)
+        if new_level <= self.level:
             return None
 
-        if self.experience >= XP_THRESHOLDS[self.level]:
+        attrs = self.character_template.base_attributes
+        new_skill_names = []
+        while self.level < new_level:
             self.level += 1
-            attrs = self.character_template.base_attributes
             newly_unlocked = self.character_template.get_available_skills(
-                self.level, self.current_abilities, attrs
+                self.level, self._ability_set, attrs
             )
-            new_skill_names = [skill.name for skill in newly_unlocked]
-
-            for skill_name in new_skill_names:
-                self.unlock_skill(skill_name)
+            for skill in newly_unlocked:
+                self.unlock_skill(skill.name)
+                new_skill_names.append(skill.name)
 
-            return new_skill_names
-
-        return None
+        return new_skill_names
 
     def update_resources(self, changes: Dict[str, int]):
         for resource, change in changes.items():
             current = self.resource_pools.get(resource, 0)
             self.resource_pools[resource] = max(0, current + change)
+        self._resource_status = None
 
     def update_cooldowns(self, turn_delta: int = 1):
-        for skill in list(self.skill_cooldowns.keys()):
-            self.skill_cooldowns[skill] = max(0, self.skill_cooldowns[skill] - turn_delta)
-            if self.skill_cooldowns[skill] == 0:
-                del self.skill_cooldowns[skill]
+        # Cooldowns that run out are dropped
+        self.skill_cooldowns = {
+            skill: remaining - turn_delta
+            for skill, remaining in self.skill_cooldowns.items()
+            if remaining > turn_delta
+        }
 
     def set_cooldown(self, skill_name: str, turns: int):
         if turns > 0:
@@ -275,44 +343,63 @@ class Player(Savable):
         return AIWrapper._get_service(self.model,self.UID)
     def get_class(self) -> PlayerClass:
         return self.player_class
-    def get_responses_history(self) -> list[str]:
+    def get_responses_history(self) -> deque[str]:
         return self._responses
-    def get_negotiation_history(self) -> list[str]:
+    def get_response_at(self, frame: int) -> str | None:
+        """Action from the given turn index, or None if it was never made or has aged out"""
+        index = frame - (self._response_count - len(self._responses))
+        if 0 <= index < len(self._responses):
+            return self._responses[index]
+        return None
+    def get_negotiation_history(self) -> deque[str]:
         return self._negotiation_messages
     def get_values(self) -> PlayerValues:
         return self.values
     #endregion
     #region: Modifier functions
-    def update_position(self, change: tuple[int,int]):
-        if (self.position[0]+change[0] < -GameConfig.world_size or self.position[0]+change[0] > GameConfig.world_size or
-            self.position[1]+change[1] < -GameConfig.world_size or self.position[1]+change[1] > GameConfig.world_size):
-            return
-        self.position = (self.position[0]+change[0],self.position[1]+change[1])
+    def update_position(self, change: tuple[int,int], world_size: int | None = None):
+        """Move by change, unless that leaves the world (default size: GameConfig.world_size)"""
+        bound = GameConfig.world_size if world_size is None else world_size
+        x = self.position[0] + change[0]
+        y = self.position[1] + change[1]
+        if -bound <= x <= bound and -bound <= y <= bound:
+            self.position = (x, y)
     #endregion
 
     @override
-    def save(self) -> str:
-        """Save player as JSON string. Players are stored in game state, not in separate database table."""
+    def to_dict(self) -> dict:
+        """
+        Player data as a plain dict in PlayerModel's shape (what save() encodes).
+        Built directly rather than validated: every field comes from this object, which
+        load() validated and whose updates keep it in range; load() validates it again.
+        The lists and dicts are the player's own, not copies: callers read or encode
+        the result right away and must not mutate it.
+        """
         player_data = {
             "uid": self.UID,
             "position": list(self.position),
             "model": self.model,
             "player_class": self.player_class.name,
-            "values": Savable.fromJSON(self.values.save()),
-            "responses": list(getattr(self, "_responses", [])),
+            "values": self.values.to_dict(),
+            "responses": list(self._responses),  # deque -> list for JSON
+            "response_count": self._response_count,
             "character_template_name": self.character_template_name,  # Use the stored template name
-            "current_abilities": list(self.current_abilities),
-            "resource_pools": dict(self.resource_pools),
-            "skill_cooldowns": dict(self.skill_cooldowns),
+            "current_abilities": self.current_abilities,
+            "resource_pools": self.resource_pools,
+            "skill_cooldowns": self.skill_cooldowns,
             "experience": self.experience,
             "level": self.level,
+            "inventory": [],  # Unused; items live in values.inventory
             "invalid_action_count": self.invalid_action_count,
             "total_action_count": self.total_action_count,
-            "agent_prompt": getattr(self, "agent_prompt", "")
+            "agent_prompt": self.agent_prompt
         }
+        return player_data
 
-        player_model = PlayerModel(**player_data)
-        return Savable.toJSON(player_model.model_dump())
+    @override
+    def save(self) -> str:
+        """Save player as JSON string. Players are stored in game state, not in separate database table."""
+        return Savable.toJSON(self.to_dict())
         
     def get_open_context(self) -> dict:
         """Get the open (visible to other players) context for the player."""
@@ -320,7 +407,7 @@ class Player(Savable):
             "uid": self.UID,
             "position": list(self.position),
             "player_class": self.player_class.name,
-            "values": Savable.fromJSON(self.values.save()),
+            "values": self.values.to_dict(),
             "responses": self._responses[-1] if self._responses else ""
         }
         return open_context
@@ -344,15 +431,15 @@ class Player(Savable):
         self.position = tuple(player_model.position)
         self.UID = player_model.uid
         self.model = player_model.model
-        self.agent_prompt = getattr(player_model, "agent_prompt", "")
+        self.agent_prompt = player_model.agent_prompt
         
         # Load player class
-        cls_key = player_model.player_class
-        self.player_class = PLAYER_CLASSES.get(cls_key, PLAYER_CLASSES["human"])
+        # Unknown classes fall back to human; the default is only looked up when needed
+        self.player_class = PLAYER_CLASSES.get(player_model.player_class) or PLAYER_CLASSES["human"]
         
-        # Load values
-        self.values = PlayerValues(player=self)
-        self.values.load(Savable.toJSON(player_model.values.model_dump()))
+        # Load values (already validated as part of PlayerModel)
+        values_model = player_model.values
+        self.values = PlayerValues(values_model.money, values_model.health, player=self, inventory=list(values_model.inventory))
 
         # Store the template name
         self.character_template_name = player_model.character_template_name
@@ -367,18 +454,22 @@ class Player(Savable):
             self.character_template = None
 
         self.current_abilities = list(player_model.current_abilities)
+        self._ability_set = set(self.current_abilities)
         self.resource_pools = dict(player_model.resource_pools)
+        self._resource_status = None
         self.skill_cooldowns = dict(player_model.skill_cooldowns)
         self.experience = player_model.experience
         self.level = player_model.level
-        self.invalid_action_count = getattr(player_model, 'invalid_action_count', 0)
-        self.total_action_count = getattr(player_model, 'total_action_count', 0)
+        self.invalid_action_count = player_model.invalid_action_count
+        self.total_action_count = player_model.total_action_count
         # Load responses
-        self._responses = list(player_model.responses)
+        self._responses = deque(player_model.responses, maxlen=MAX_RESPONSE_HISTORY)
+        # Older saves have no count; their stored responses are the whole history
+        self._response_count = max(player_model.response_count, len(player_model.responses))
         
         # Initialize negotiation messages (not persisted, so always start fresh)
         if not hasattr(self, '_negotiation_messages'):
-            self._negotiation_messages = []
+            self._negotiation_messages = deque(maxlen=MAX_RESPONSE_HISTORY)
 
 
 
@@ -1,10 +1,12 @@
 from database.fileManager import Savable
-from typing import List
+from collections.abc import MutableMapping
+from typing import Iterator, List
 from typing_extensions import override
-import json
+import sys
 
 class Secret:
     """Secret class representing a key-value pair for tile secrets."""
+    __slots__ = ('key', 'value')  # A world holds thousands of these; no per-instance __dict__
     def __init__(self, key: str, value: int):
         self.key = key
         self.value = value
@@ -30,59 +32,69 @@ class Secret:
     def __repr__(self):
         return f"Secret(key='{self.key}', value={self.value})"
 
+# Secret conversion by exact type; anything else is expected to be a SecretKV-like model
+_SECRET_CONVERTERS = {Secret: lambda s: s, tuple: Secret.from_tuple, dict: Secret.from_dict}
+
+def _to_secret(s) -> Secret | None:
+    convert = _SECRET_CONVERTERS.get(type(s))
+    if convert is not None:
+        return convert(s)
+    try:
+        # Handle SecretKV pydantic models
+        return Secret(s.key, s.value)
+    except AttributeError:
+        return None
+
+def _to_secrets(secrets) -> List[Secret]:
+    """Convert various formats to Secret objects, dropping entries that aren't secrets"""
+    if not secrets:
+        return []
+    return [secret for secret in map(_to_secret, secrets) if secret is not None]
+
+def _saved_secrets(data: str | list) -> List[Secret]:
+    """
+    Secrets as stored: a JSON string of [key, value] pairs (Tile.save), or a list of
+    SecretKV dicts (TileModel.model_dump, e.g. tiles loaded from game state)
+    """
+    if isinstance(data, str):
+        data = Savable.fromJSON(data)
+    return _to_secrets(tuple(item) if isinstance(item, list) else item for item in data)
+
 class Tile(Savable):
     """Tile class for game world. Tiles are stored as part of game state, not in separate database table."""
+    __slots__ = ('position', 'description', 'secrets', 'terrainType', 'terrainEmoji', '_dirty')
     position: tuple[int,int]
     description: str
     secrets: List[Secret]
     terrainType: str
     terrainEmoji: str
-    def __init__(self, description: str = "", position: tuple[int,int] = (0,0), secrets: List[Secret | tuple[str, int] | dict] = [], terrainType: str = "plains", terrainEmoji: str = "🌾"):
+    _dirty: bool  # Changed since Game.save last built its TileModel
+    def __init__(self, description: str = "", position: tuple[int,int] = (0,0), secrets: List[Secret | tuple[str, int] | dict] | None = None, terrainType: str = "plains", terrainEmoji: str = "🌾"):
         self.description = description
         self.position = position
-        # Convert various formats to Secret objects
-        converted_secrets = []
-        for s in secrets:
-            if isinstance(s, Secret):
-                converted_secrets.append(s)
-            elif isinstance(s, tuple):
-                converted_secrets.append(Secret.from_tuple(s))
-            elif isinstance(s, dict):
-                converted_secrets.append(Secret.from_dict(s))
-            elif hasattr(s, 'key') and hasattr(s, 'value'):
-                # Handle SecretKV pydantic models
-                converted_secrets.append(Secret(s.key, s.value))
-        self.secrets = converted_secrets
-        self.terrainType = terrainType
-        self.terrainEmoji = terrainEmoji
+        self.secrets = _to_secrets(secrets)
+        # Only a handful of terrains exist, so every tile shares the same few strings
+        self.terrainType = sys.intern(str(terrainType))
+        self.terrainEmoji = sys.intern(str(terrainEmoji))
+        self._dirty = True
     def update_description(self, new_description: str):
         self.description = new_description
+        self._dirty = True
     def update_secrets(self, secrets: List[Secret | tuple[str,int] | dict]):
-        # Convert various formats to Secret objects
-        converted_secrets = []
-        for s in secrets:
-            if isinstance(s, Secret):
-                converted_secrets.append(s)
-            elif isinstance(s, tuple):
-                converted_secrets.append(Secret.from_tuple(s))
-            elif isinstance(s, dict):
-                converted_secrets.append(Secret.from_dict(s))
-            elif hasattr(s, 'key') and hasattr(s, 'value'):
-                # Handle SecretKV pydantic models
-                converted_secrets.append(Secret(s.key, s.value))
-        self.secrets = converted_secrets
+        self.secrets = _to_secrets(secrets)
+        self._dirty = True
     @override
     def to_dict(self) -> dict:
         return {
-            "position": [self.position[0], self.position[1]],  # Store as list for JSON compatibility
+            "position": self.position,  # Tuples encode as JSON arrays (json and orjson alike)
             "description": self.description,
-            "secrets": json.dumps([[s.key, s.value] for s in self.secrets]),
+            "secrets": Savable.toJSON([[s.key, s.value] for s in self.secrets]),
             "terrainType": self.terrainType,
             "terrainEmoji": self.terrainEmoji
         }
     def clean_to_dict(self) -> dict:
         return {
-            "position": [self.position[0], self.position[1]],  # Store as list for JSON compatibility
+            "position": self.position,  # Tuples encode as JSON arrays (json and orjson alike)
             "description": self.description,
             "terrainType": self.terrainType,
             "terrainEmoji": self.terrainEmoji
@@ -92,12 +104,10 @@ class Tile(Savable):
         pos_list = data.get("position", [0, 0])
         if not isinstance(pos_list, (list, tuple)) or len(pos_list) != 2:
             pos_list = [0, 0]
-        secrets_data = json.loads(data.get("secrets", "[]"))
-        secrets = [Secret(item[0], item[1]) for item in secrets_data]
         return cls(     
             description=data.get("description", ""),
             position=(int(pos_list[0]), int(pos_list[1])),
-            secrets=secrets,
+            secrets=_saved_secrets(data.get("secrets", "[]")),
             terrainType=data.get("terrainType", "plains"),
             terrainEmoji=data.get("terrainEmoji", "🌾")
         )
@@ -120,9 +130,77 @@ class Tile(Savable):
         if not isinstance(pos_list, (list, tuple)) or len(pos_list) != 2:
             pos_list = [0, 0]
 
-        secrets_data = json.loads(loaded_data.get("secrets", "[]"))
-        self.secrets = [Secret(item[0], item[1]) for item in secrets_data]
+        self.secrets = _saved_secrets(loaded_data.get("secrets", "[]"))
         self.position = (int(pos_list[0]), int(pos_list[1]))
         self.description = loaded_data.get("description", "")
-        self.terrainType = loaded_data.get("terrainType", "plains")
-        self.terrainEmoji = loaded_data.get("terrainEmoji", "🌾")
\ No newline at end of file
+        self.terrainType = sys.intern(str(loaded_data.get("terrainType", "plains")))
+        self.terrainEmoji = sys.intern(str(loaded_data.get("terrainEmoji", "🌾")))
+        self._dirty = True
+
+
+class TileGrid(MutableMapping):
+    """
+    Tiles of a (2W+1) x (2W+1) world kept in one flat list, indexed by position.
+
+    Behaves like dict[tuple[int, int], Tile]: unfilled cells are simply absent,
+    so tiles can still be generated on demand. Positions outside the world
+    raise KeyError. Iteration is in grid order (x, then y).
+    """
+    __slots__ = ("world_size", "_side", "_cells", "_count")
+
+    def __init__(self, world_size: int, tiles: dict[tuple[int, int], Tile] | None = None):
+        self.world_size = world_size
+        self._side = 2 * world_size + 1
+        self._cells: list[Tile | None] = [None] * (self._side * self._side)
+        self._count = 0
+        if tiles:
+            self.update(tiles)
+
+    def _index(self, position: tuple[int, int]) -> int:
+        x, y = position
+        w = self.world_size
+        if -w <= x <= w and -w <= y <= w:
+            return (x + w) * self._side + (y + w)
+        raise KeyError(position)
+
+    def _position(self, index: int) -> tuple[int, int]:
+        return (index // self._side - self.world_size, index % self._side - self.world_size)
+
+    def __getitem__(self, position: tuple[int, int]) -> Tile:
+        tile = self._cells[self._index(position)]
+        if tile is None:
+            raise KeyError(position)
+        return tile
+
+    def __setitem__(self, position: tuple[int, int], tile: Tile) -> None:
+        i = self._index(position)
+        if self._cells[i] is None:
+            self._count += 1
+        self._cells[i] = tile
+
+    def __delitem__(self, position: tuple[int, int]) -> None:
+        i = self._index(position)
+        if self._cells[i] is None:
+            raise KeyError(position)
+        self._cells[i] = None
+        self._count -= 1
+
+    def __contains__(self, position) -> bool:
+        try:
+            return self._cells[self._index(position)] is not None
+        except (KeyError, TypeError, ValueError):
+            return False
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        for i, tile in enumerate(self._cells):
+            if tile is not None:
+                yield self._position(i)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def values(self) -> list[Tile]:
+        return [tile for tile in self._cells if tile is not None]
+
+    def items(self) -> list[tuple[tuple[int, int], Tile]]:
+        return [(self._position(i), tile) for i, tile in enumerate(self._cells) if tile is not None]
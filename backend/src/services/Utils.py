@@ -1,6 +1,20 @@
 import json
 from core.settings import AIConfig
+try:
+    import orjson
+except ImportError:  # Optional dependency; the stdlib json module is used without it
+    orjson = None
+
+
+def _dump_context(context: dict) -> str:
+    """Indented JSON for prompts; non-ASCII (e.g. terrain emojis) is kept as is by both encoders"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(context, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers past 64 bits, which the stdlib encoder still handles
+    return json.dumps(context, indent=2, ensure_ascii=False)
 
 
 def format_request(prompt: str, context: dict, schema: str = "") -> str:
-    return f"{prompt}\n\nContext:\n{json.dumps(context, indent=2)} \n\nSchema:\n{schema}"
\ No newline at end of file
+    return f"{prompt}\n\nContext:\n{_dump_context(context)} \n\nSchema:\n{schema}"
@@ -1,21 +1,47 @@
 # implements the AiServicesBase class for OpenAI
 
+from functools import lru_cache
 from typing import Optional, List, Dict
+import httpx
+from openai import OpenAI
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage, AIMessage
 from pydantic import BaseModel
 from ..AiServicesBase import AiServicesBase
-from core.settings import ai_config
+from core.settings import ai_config, GameConfig
 import uuid
 import inspect
 
+
+@lru_cache(maxsize=None)
+def _shared_http_client() -> httpx.Client:
+    """
+    One keep-alive HTTP/2 connection pool for every OpenAiService. Each chat session
+    gets its own service, so without this every player and tile session would open
+    its own connections; sharing them also lets concurrent requests from one turn
+    arrive together at servers that batch them (e.g. vLLM).
+    """
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=GameConfig.max_concurrency,
+            max_keepalive_connections=GameConfig.max_concurrency,
+        ),
+        http2=True,
+    )
+
+
+@lru_cache(maxsize=None)
+def shared_openai_client() -> OpenAI:
+    """OpenAI SDK client on the shared connection pool, for calls outside chat sessions (e.g. the Batch API)"""
+    return OpenAI(api_key=ai_config.openai_api_key or None, http_client=_shared_http_client())
+
 class OpenAiService(AiServicesBase):
 
     llm: ChatOpenAI
     chat_prompt: ChatPromptTemplate
 
-    def __init__(self, chat_id: str = uuid.uuid4(), history: Optional[List[Dict]] = None, model: str = "gpt-4.1-mini", temperature: float = 0.7, system_prompt: str = ai_config.system_prompt):
+    def __init__(self, chat_id: str = uuid.uuid4(), history: Optional[List[Dict]] = None, model: str = "gpt-4.1-mini", temperature: float = 0.7, system_prompt: str = ai_config.system_prompt, prompt_cache_key: Optional[str] = None, seed: Optional[int] = None):
         """
         Initialize the OpenAI service.
         Args:
@@ -23,6 +49,9 @@ class OpenAiService(AiServicesBase):
             history: The history of the chat.
             model: The model to use. be careful the model supports structured output.
             system_prompt: The system prompt to use.
+            prompt_cache_key: Routes requests sharing a prompt prefix to the same OpenAI
+                prompt cache (defaults to chat_id, whose prefix repeats every turn).
+            seed: Sampling seed for best-effort reproducible responses.
         """
         super().__init__(chat_id, history, system_prompt)
 
@@ -36,6 +65,9 @@ class OpenAiService(AiServicesBase):
             timeout=ai_config.openai_timeout,
             api_key=ai_config.openai_api_key,
             max_retries=2,
+            http_client=_shared_http_client(),
+            extra_body={"prompt_cache_key": prompt_cache_key or str(chat_id)},
+            seed=seed,
         )
         
         # Create ChatPromptTemplate with system message and chat history placeholder
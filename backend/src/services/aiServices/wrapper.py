@@ -1,15 +1,34 @@
 from typing import Optional, Type
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from ..AiServicesBase import AiServicesBase
 from .openai import OpenAiService
 from .mock import MockAiService
 from .claude import ClaudeService
 from core.settings import ai_config
+import asyncio
+import re
 import uuid
 import inspect
 import sys, traceback
 
 
+class BatchReply(BaseModel):
+    # Defaults keep one malformed item from failing the whole batch; ask_batch drops it instead
+    owner_id: str = Field(default="", description="The id in brackets of the request being answered")
+    reply: str = Field(default="", description="The reply to that request, exactly as if it had been asked alone")
+
+
+class BatchRepliesModel(BaseModel):
+    replies: list[BatchReply] = Field(default_factory=list)
+
+
+BATCH_INSTRUCTIONS = (
+    "You will receive several independent requests, each labeled with an id in brackets. "
+    "Answer each one on its own, using only the information inside that request, and return "
+    "exactly one reply per id."
+)
+
+
 class AIWrapper:
     """Unified interface for all AI services"""
 
@@ -22,7 +41,9 @@ class AIWrapper:
             chat_id: Optional[str] = None,
             system_prompt: Optional[str] = None,
             structured_output: Optional[Type[BaseModel]] = None,
-            isolated: bool = False, verbose: int = 1) -> Optional[str | BaseModel]:
+            isolated: bool = False, verbose: int = 1,
+            cache_key: Optional[str] = None,
+            seed: Optional[int] = None) -> Optional[str | BaseModel]:
         """
         Send message to AI service and get response
 
@@ -34,6 +55,9 @@ class AIWrapper:
             structured_output: Pydantic model for structured responses
             isolated: If True, don't use chat history
             verbose: Verbose level (0=non-verbose, 1=verbose, 2=full_verbose)
+            cache_key: Provider prompt-cache key for a new session (defaults to chat_id);
+                share one across short-lived sessions that send the same prompt prefix
+            seed: Sampling seed for a new session, where the provider supports one
 
         Returns:
             Response string or Pydantic model instance
@@ -54,7 +78,7 @@ class AIWrapper:
                 print(f"[AI] Initializing backend for model '{model}'...")
                 print(f"[AI] Model supports structured output: {'yes' if structured_output else 'no'}")
         
-            service = cls._get_service(model, chat_id, system_prompt)
+            service = cls._get_service(model, chat_id, system_prompt, cache_key, seed)
             if verbose >= 2:
                 print("[AI] Service ready.")
                 print(f"[AI] Current history length: {len(service.history)} messages")
@@ -79,6 +103,74 @@ class AIWrapper:
             traceback.print_exc()          # full stack with line numbers
             raise             
 
+    @classmethod
+    async def aask(cls,
+                   message: str,
+                   model: str = "gpt-4.1-mini",
+                   chat_id: Optional[str] = None,
+                   system_prompt: Optional[str] = None,
+                   structured_output: Optional[Type[BaseModel]] = None,
+                   isolated: bool = False, verbose: int = 1,
+                   cache_key: Optional[str] = None,
+                   seed: Optional[int] = None) -> Optional[str | BaseModel]:
+        """
+        Awaitable ask(): runs the request in a worker thread so callers can
+        asyncio.gather several of them. Same arguments and return value as ask().
+        """
+        return await asyncio.to_thread(
+            cls.ask, message, model, chat_id, system_prompt, structured_output, isolated, verbose, cache_key, seed
+        )
+
+    @classmethod
+    def ask_batch(cls,
+                  prompts: list[str],
+                  owner_ids: list[str],
+                  model: str = "gpt-4.1-mini",
+                  verbose: int = 1) -> list[Optional[str]]:
+        """
+        Answer several independent prompts with a single request
+
+        Args:
+            prompts: One full prompt per owner
+            owner_ids: Chat session ID each prompt belongs to
+            model: Model identifier shared by all owners
+
+        Returns:
+            One reply per owner, in order; None where the model skipped an owner,
+            so callers can fall back to ask(). Each answered prompt/reply pair is
+            appended to its owner's own history, as if asked individually.
+        """
+        sections = "\n\n".join(
+            f"[{owner_id}]\n{prompt}" for owner_id, prompt in zip(owner_ids, prompts)
+        )
+        batch_id = f"batch_{uuid.uuid4().hex}"
+        try:
+            result = cls.ask(
+                f"{BATCH_INSTRUCTIONS}\n\n{sections}",
+                model,
+                batch_id,
+                structured_output=BatchRepliesModel,
+                verbose=verbose
+            )
+        finally:
+            cls.reset(batch_id)
+
+        # Keep the first non-empty reply per requested id; anything else counts as skipped
+        replies = {}
+        if isinstance(result, BatchRepliesModel):
+            wanted = set(owner_ids)
+            for item in result.replies:
+                owner_id = item.owner_id.strip().strip("[]")
+                if owner_id in wanted and owner_id not in replies and item.reply.strip():
+                    replies[owner_id] = item.reply
+        ordered = [replies.get(owner_id) for owner_id in owner_ids]
+        for owner_id, prompt, reply in zip(owner_ids, prompts, ordered):
+            if reply is not None:
+                history = cls._get_service(model, owner_id, None).history
+                history.append({"role": "user", "content": prompt})
+                history.append({"role": "assistant", "content": reply})
+        return ordered
+
     @classmethod
     def reset(cls, chat_id: str):
         """Reset chat history for a session and remove the service to force fresh creation"""
@@ -94,32 +186,46 @@ class AIWrapper:
             return cls._services[chat_id].get_history()
         return []
 
+    @staticmethod
+    def provider(model: str) -> str:
+        """Provider that serves a model: "openai", "claude" or "mock"; raises ValueError for unknown models"""
+        name = model.lower()
+        # OpenAI's reasoning models (o1, o3-mini, o4-mini, ...) don't carry "gpt" in their names
+        if "gpt" in name or "openai" in name or re.match(r"o\d", name):
+            return "openai"
+        if "claude" in name:
+            return "claude"
+        if "mock" in name:
+            return "mock"
+        raise ValueError(f"Unknown model: {model}")
+
     @classmethod
-    def _get_service(cls, model: str, chat_id: str, system_prompt: Optional[str]) -> AiServicesBase:
+    def _get_service(cls, model: str, chat_id: str, system_prompt: Optional[str], cache_key: Optional[str] = None, seed: Optional[int] = None) -> AiServicesBase:
         """Get or create AI service instance"""
         if chat_id not in cls._services:
             prompt = system_prompt or ai_config.system_prompt
 
-            if "gpt" in model.lower() or "openai" in model.lower():
+            provider = cls.provider(model)
+            if provider == "openai":
                 cls._services[chat_id] = OpenAiService(
                     chat_id=chat_id,
                     model=model,
-                    system_prompt=prompt
+                    system_prompt=prompt,
+                    prompt_cache_key=cache_key,
+                    seed=seed
                 )
-            elif "claude" in model.lower():
+            elif provider == "claude":
                 cls._services[chat_id] = ClaudeService(
                     chat_id=chat_id,
                     model=model,
                     system_prompt=prompt
                 )
-            elif "mock" in model.lower():
+            else:
                 cls._services[chat_id] = MockAiService(
                     chat_id=chat_id,
                     model=model,
                     system_prompt=prompt
                 )
-            else:
-                raise ValueError(f"Unknown model: {model}")
 
         return cls._services[chat_id]
 
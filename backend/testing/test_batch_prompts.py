@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for batched player prompts: AIWrapper.ask_batch and the batch path of Game._aask_players
+The mock model answers batch requests with a scripted BatchRepliesModel
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.settings import GameConfig
+from src.app.Game import Game
+from src.app.Player import DEAD_PLAYER_RESPONSE
+from src.services.aiServices.mock import MockAiService
+from src.services.aiServices.wrapper import AIWrapper, BatchRepliesModel, BatchReply
+
+MOCK_REPLY = "[MOCK] ok."
+
+
+@pytest.fixture
+def batch_replies(monkeypatch):
+    """Script the replies of the next batch requests; collects the batch prompts sent"""
+    scripted: list[BatchReply] = []
+    batch_prompts: list[str] = []
+
+    def answer(self, message, structured_output_class):
+        assert structured_output_class is BatchRepliesModel
+        batch_prompts.append(message)
+        return BatchRepliesModel(replies=list(scripted))
+
+    monkeypatch.setattr(MockAiService, "ask_ai_response_with_structured_output", answer)
+    before = set(AIWrapper._services)
+    yield scripted, batch_prompts
+    for chat_id in set(AIWrapper._services) - before:
+        AIWrapper.reset(chat_id)
+
+
+def _exchanges(chat_id: str) -> list[tuple[str, str]]:
+    history = AIWrapper.get_history(chat_id)
+    return [(history[i]["content"], history[i + 1]["content"]) for i in range(0, len(history), 2)]
+
+
+def test_ask_batch_replies_per_owner(batch_replies):
+    scripted, batch_prompts = batch_replies
+    # Out of order, with the ids still in brackets as they appear in the prompt
+    scripted += [BatchReply(owner_id="[b2]", reply="reply b"), BatchReply(owner_id="a1", reply="reply a")]
+
+    replies = AIWrapper.ask_batch(["prompt a", "prompt b"], ["a1", "b2"], model="mock", verbose=0)
+
+    assert replies == ["reply a", "reply b"]
+    assert len(batch_prompts) == 1
+    assert "[a1]\nprompt a" in batch_prompts[0] and "[b2]\nprompt b" in batch_prompts[0]
+    # Each owner's history holds only its own prompt and reply
+    assert _exchanges("a1") == [("prompt a", "reply a")]
+    assert _exchanges("b2") == [("prompt b", "reply b")]
+    # The combined batch session is not kept around
+    assert not any(chat_id.startswith("batch_") for chat_id in AIWrapper._services)
+
+
+def test_ask_batch_skipped_and_malformed_items(batch_replies):
+    scripted, _ = batch_replies
+    scripted += [
+        BatchReply(owner_id="a1", reply="reply a"),
+        BatchReply(owner_id="a1", reply="second reply a"),  # duplicate: first one wins
+        BatchReply(owner_id="b2", reply="   "),  # empty reply
+        BatchReply(owner_id="z9", reply="not asked"),  # unknown id
+        BatchReply(reply="no owner"),  # missing id
+    ]
+
+    replies = AIWrapper.ask_batch(["prompt a", "prompt b", "prompt c"], ["a1", "b2", "c3"], model="mock", verbose=0)
+
+    assert replies == ["reply a", None, None]
+    assert _exchanges("a1") == [("prompt a", "reply a")]
+    assert _exchanges("b2") == []
+    assert _exchanges("c3") == []
+    assert "z9" not in AIWrapper._services
+
+
+def test_players_fall_back_to_ask_individually(batch_replies, monkeypatch):
+    """Players the batch didn't answer are asked on their own; answered and dead players aren't"""
+    scripted, batch_prompts = batch_replies
+    scripted += [BatchReply(owner_id="p1", reply="p1 acts"), BatchReply(owner_id="p2", reply="")]
+    monkeypatch.setattr(GameConfig, "batch_player_prompts", True)
+
+    game = Game({
+        uid: {"uid": uid, "position": [0, 0], "model": "mock"}
+        for uid in ("p1", "p2", "p3")
+    } | {"p4": {"uid": "p4", "position": [0, 0], "model": "mock", "values": {"health": 0}}})
+    sorted_uids = sorted(game.players)
+    contexts = {uid: {"uid": uid} for uid in sorted_uids}
+
+    results = asyncio.run(game._aask_players(sorted_uids, contexts, negotiation=False))
+
+    assert results == {"p1": "p1 acts", "p2": MOCK_REPLY, "p3": MOCK_REPLY, "p4": DEAD_PLAYER_RESPONSE}
+    # The dead player was left out of the batch request
+    assert len(batch_prompts) == 1
+    assert "[p4]" not in batch_prompts[0]
+    # One exchange each: the batched reply for p1, an individual ask for p2 and p3
+    for uid in ("p1", "p2", "p3"):
+        assert len(_exchanges(uid)) == 1
+        prompt, reply = _exchanges(uid)[0]
+        assert prompt == game.players[uid].action_request(contexts[uid])
+        assert reply == results[uid]
+        assert list(game.players[uid].get_responses_history()) == [results[uid]]
+    assert _exchanges("p4") == []
+    assert list(game.players["p4"].get_responses_history()) == []
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
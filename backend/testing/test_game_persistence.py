@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for Game and Player persistence
+Storage is replaced by in-memory fakes, so no database or AI access is needed
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.app.Game as game_module
+from src.app.Game import Game
+from src.app.Player import Player, MAX_RESPONSE_HISTORY
+
+
+def test_unchanged_game_row_is_saved_once(monkeypatch):
+    """A second save of unchanged metadata skips the games row, even after the adapter dumped it"""
+    saved_rows = []
+
+    def fake_save_game(game_model, new=False):
+        # Like the Supabase adapter, which fills the model's row cache
+        saved_rows.append(game_model.to_row())
+        return game_model.id
+
+    monkeypatch.setattr(game_module, "save_game_to_database", fake_save_game)
+    monkeypatch.setattr(game_module, "save_turn_to_database", lambda turn: 1)
+
+    game = Game({})
+    game.save()
+    game.save()
+    assert len(saved_rows) == 1
+
+    game.name = "Renamed"
+    game.save()
+    assert len(saved_rows) == 2
+    assert saved_rows[-1]["name"] == "Renamed"
+
+
+def test_response_frames_survive_reload_past_history_cap():
+    """Frame indices still line up after reloading more responses than the in-memory cap"""
+    player = Player("p1")
+    total = MAX_RESPONSE_HISTORY + 44
+    for turn in range(total):
+        player.record_action(f"action {turn}")
+
+    reloaded = Player("p1")
+    reloaded.load(player.to_dict())
+    assert reloaded.get_response_at(total - 1) == f"action {total - 1}"
+    assert reloaded.get_response_at(total - MAX_RESPONSE_HISTORY) == f"action {total - MAX_RESPONSE_HISTORY}"
+    assert reloaded.get_response_at(total - MAX_RESPONSE_HISTORY - 1) is None
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
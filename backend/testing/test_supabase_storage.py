@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the Supabase storage adapters
+Requests go to an httpx.MockTransport, so no Supabase project is needed
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.storage import supabase_storage_adapter as adapter_module
+from schema.gameModel import GameModel
+
+httpx = pytest.importorskip("httpx")
+if not adapter_module.SUPABASE_AVAILABLE:
+    pytest.skip("supabase client not installed", allow_module_level=True)
+
+SUPABASE_URL = "http://supabase.test"
+SUPABASE_KEY = "test-key"
+
+
+@pytest.fixture
+def sent_requests(monkeypatch):
+    """Route the shared Supabase client through a MockTransport and collect its requests"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(201, json=[])
+
+    make_client = adapter_module._http_client
+    monkeypatch.setattr(adapter_module, "_http_client", lambda: make_client(transport=httpx.MockTransport(handler)))
+    adapter_module._shared_client.cache_clear()
+    yield requests
+    adapter_module._shared_client.cache_clear()
+
+
+def _save_game(game_id: str) -> None:
+    adapter = adapter_module.SupabaseGameStorageAdapter(SUPABASE_URL, SUPABASE_KEY)
+    assert adapter.save(GameModel(id=game_id)) == game_id
+
+
+@pytest.mark.skipif(adapter_module.orjson is None, reason="orjson not installed")
+def test_save_sends_orjson_body(sent_requests):
+    """With orjson, the row is sent as orjson's bytes"""
+    _save_game("g1")
+
+    request = sent_requests[-1]
+    assert request.method == "POST"
+    assert request.headers["Content-Type"] == "application/json"
+    row = GameModel(id="g1").to_row()
+    assert request.content == adapter_module.orjson.dumps(row)
+
+
+def test_save_without_orjson(sent_requests, monkeypatch):
+    """Without orjson, the plain httpx client encodes the row"""
+    monkeypatch.setattr(adapter_module, "orjson", None)
+    _save_game("g2")
+
+    request = sent_requests[-1]
+    assert request.method == "POST"
+    assert json.loads(request.content) == GameModel(id="g2").to_row()
+
+
+def test_older_supabase_uses_default_client(monkeypatch):
+    """supabase-py releases without ClientOptions.httpx_client get a client with default options"""
+    created = []
+
+    class OldClientOptions:
+        __dataclass_fields__ = {"schema": None, "headers": None}
+
+    monkeypatch.setattr(adapter_module, "ClientOptions", OldClientOptions)
+    monkeypatch.setattr(adapter_module, "create_client", lambda *args, **kwargs: created.append((args, kwargs)))
+    adapter_module._shared_client.cache_clear()
+    try:
+        adapter_module._shared_client(SUPABASE_URL, SUPABASE_KEY)
+    finally:
+        adapter_module._shared_client.cache_clear()
+    assert created == [((SUPABASE_URL, SUPABASE_KEY), {})]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
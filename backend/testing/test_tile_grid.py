@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for TileGrid, the flat-list tile map used by Game
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.app.Game import Game
+from src.app.Tile import Tile, TileGrid
+
+
+def test_index_is_row_major_over_the_world():
+    """(x, y) maps to (x+W)*(2W+1)+(y+W), covering every cell exactly once"""
+    grid = TileGrid(2)
+    side = 5
+    positions = [(x, y) for x in range(-2, 3) for y in range(-2, 3)]
+    indices = [grid._index(position) for position in positions]
+    assert indices == [(x + 2) * side + (y + 2) for x, y in positions]
+    assert sorted(indices) == list(range(side * side))
+    assert all(grid._position(grid._index(position)) == position for position in positions)
+
+
+def test_out_of_bounds_positions():
+    grid = TileGrid(1)
+    for position in [(2, 0), (0, -2), (-2, 2)]:
+        with pytest.raises(KeyError):
+            grid[position] = Tile("outside", position)
+        with pytest.raises(KeyError):
+            grid[position]
+        assert position not in grid
+        assert grid.get(position) is None
+    assert "not a position" not in grid
+    assert len(grid) == 0
+
+
+def test_unfilled_cells_are_absent():
+    """len, iteration, items and values only see filled cells, in grid order"""
+    grid = TileGrid(1)
+    assert len(grid) == 0
+    assert list(grid) == []
+    assert (0, 0) not in grid
+    with pytest.raises(KeyError):
+        grid[(0, 0)]
+
+    a, b = Tile("a", (1, -1)), Tile("b", (-1, 0))
+    grid[(1, -1)] = a
+    grid[(-1, 0)] = b
+    grid[(1, -1)] = a  # replacing a tile doesn't count it twice
+    assert len(grid) == 2
+    assert list(grid) == [(-1, 0), (1, -1)]
+    assert grid.items() == [((-1, 0), b), ((1, -1), a)]
+    assert grid.values() == [b, a]
+
+    del grid[(-1, 0)]
+    assert len(grid) == 1
+    assert list(grid) == [(1, -1)]
+    with pytest.raises(KeyError):
+        del grid[(-1, 0)]
+
+
+def test_load_skips_tiles_outside_the_world():
+    game = Game({})
+    game.load({
+        "id": "tile-grid-test",
+        "name": "Tile grid test",
+        "world_size": 1,
+        "game_state": {
+            "tiles": [
+                {"position": [0, 0], "description": "inside"},
+                {"position": [1, -1], "description": "corner", "secrets": [{"key": "coins", "value": 3}]},
+                {"position": [5, 5], "description": "outside"},
+            ]
+        },
+    })
+    assert isinstance(game.tiles, TileGrid)
+    assert game.tiles.world_size == 1
+    assert len(game.tiles) == 2
+    assert sorted(game.tiles) == [(0, 0), (1, -1)]
+    assert [(s.key, s.value) for s in game.tiles[(1, -1)].secrets] == [("coins", 3)]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Tests for full/delta turn snapshots: Game.save writes a full snapshot every
+GameConfig.full_snapshot_interval turns and changed tiles in between;
+turnService rebuilds the full state on read
+"""
+
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.app.Game as game_module
+import services.database.turnService as turn_service
+from core.settings import GameConfig
+from src.app.Game import Game
+from src.app.Tile import Tile
+
+
+class InMemoryTurnStorage:
+    """Turn storage keeping copies of saved rows, like a database would"""
+    def __init__(self):
+        self.rows = {}
+
+    def save(self, turn):
+        turn_id = len(self.rows) + 1
+        self.rows[turn_id] = turn.model_copy(update={"id": turn_id}, deep=True)
+        return turn_id
+
+    def load(self, turn_id):
+        if turn_id not in self.rows:
+            raise ValueError(f"Turn {turn_id} not found")
+        return self.rows[turn_id]
+
+    def get_by_game_id(self, game_id, limit=None):
+        turns = sorted(
+            (turn for turn in self.rows.values() if turn.game_id == game_id),
+            key=lambda turn: (turn.turn_number, turn.id),
+        )
+        return turns[-limit:] if limit else turns
+
+    def get_latest_by_game_id(self, game_id):
+        turns = self.get_by_game_id(game_id)
+        if not turns:
+            raise ValueError(f"No turns found for game {game_id}")
+        return turns[-1]
+
+
+class InMemoryStorageFactory:
+    def __init__(self):
+        self.turns = InMemoryTurnStorage()
+        self.games = {}
+
+    def create_turn_storage(self):
+        return self.turns
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    """Route turn storage to memory and capture game rows"""
+    factory = InMemoryStorageFactory()
+    monkeypatch.setattr(turn_service, "get_storage_factory", lambda: factory)
+    monkeypatch.setattr(game_module, "save_game_to_database", lambda game: factory.games.__setitem__(game.id, game))
+    monkeypatch.setattr(game_module, "load_game_from_database", lambda game_id: factory.games[game_id])
+    monkeypatch.setattr(GameConfig, "full_snapshot_interval", 3)
+    return factory
+
+
+def _new_game() -> Game:
+    game = Game({}, world_size=2)
+    game.game_id = "snapshot-test"
+    return game
+
+
+def _set_tile(game: Game, position, description: str) -> None:
+    """Add or change a tile the way tile generation and verdicts do"""
+    if position in game.tiles:
+        game.tiles[position].update_description(description)
+    else:
+        game.tiles[position] = Tile(description, position)
+    game._mark_tiles_dirty([position])
+
+
+def _tiles(turn) -> dict:
+    return {tuple(tile.position): tile.description for tile in turn.game_state.tiles}
+
+
+def test_full_snapshot_every_interval(storage):
+    game = _new_game()
+    turn_ids = []
+    for turn_number in range(7):
+        game.current_turn_number = turn_number
+        _set_tile(game, (0, 0), f"turn {turn_number}")
+        game.save()
+        turn_ids.append(max(storage.turns.rows))
+
+    rows = [storage.turns.rows[turn_id] for turn_id in turn_ids]
+    snapshot_ids = [row.game_state.snapshot_turn_id for row in rows]
+    # Turns 0, 3 and 6 are full snapshots; the others point at the latest one before them
+    assert snapshot_ids == [None, turn_ids[0], turn_ids[0], None, turn_ids[3], turn_ids[3], None]
+
+
+def test_cumulative_deltas_rebuild_full_state(storage):
+    game = _new_game()
+    _set_tile(game, (0, 0), "a")
+    _set_tile(game, (1, 0), "b")
+    game.save()
+
+    game.current_turn_number = 1
+    _set_tile(game, (0, 0), "a changed")
+    game.save()
+
+    game.current_turn_number = 2
+    _set_tile(game, (0, 1), "c")
+    game.save()
+
+    # Each delta carries every tile changed since the snapshot, not just this turn's
+    deltas = [storage.turns.rows[2], storage.turns.rows[3]]
+    assert _tiles(deltas[0]) == {(0, 0): "a changed"}
+    assert _tiles(deltas[1]) == {(0, 0): "a changed", (0, 1): "c"}
+
+    turns = turn_service.get_turns_by_game_id(game.game_id)
+    assert [turn.game_state.snapshot_turn_id for turn in turns] == [None, None, None]
+    assert _tiles(turns[1]) == {(0, 0): "a changed", (1, 0): "b"}
+    assert _tiles(turns[2]) == {(0, 0): "a changed", (1, 0): "b", (0, 1): "c"}
+
+    # The snapshot isn't among the turns read, so it is fetched from storage
+    latest = turn_service.get_turns_by_game_id(game.game_id, limit=1)[0]
+    assert _tiles(latest) == _tiles(turns[2])
+    assert _tiles(turn_service.load_turn_from_database(3)) == _tiles(turns[2])
+
+
+def test_repeated_turn_numbers(storage):
+    """Saving the same turn again writes another delta over the same snapshot"""
+    game = _new_game()
+    _set_tile(game, (0, 0), "a")
+    game.save()
+
+    game.current_turn_number = 1
+    _set_tile(game, (1, 1), "first")
+    game.save()
+    _set_tile(game, (1, 1), "second")
+    game.save()
+
+    rows = storage.turns.rows
+    assert [row.turn_number for row in rows.values()] == [0, 1, 1]
+    assert rows[2].game_state.snapshot_turn_id == 1
+    assert rows[3].game_state.snapshot_turn_id == 1
+
+    latest = turn_service.get_latest_turn_by_game_id(game.game_id)
+    assert latest.id == 3
+    assert _tiles(latest) == {(0, 0): "a", (1, 1): "second"}
+
+    # Repeats don't count towards the interval
+    game.current_turn_number = 2
+    game.save()
+    assert rows[4].game_state.snapshot_turn_id == 1
+
+
+def test_first_save_after_load_is_full_snapshot(storage):
+    game = _new_game()
+    _set_tile(game, (0, 0), "a")
+    _set_tile(game, (1, 0), "b")
+    game.save()
+    game.current_turn_number = 1
+    _set_tile(game, (0, 0), "a changed")
+    game.save()
+
+    loaded = Game({})
+    loaded.load(game_id=game.game_id)
+    assert loaded.current_turn_number == 1
+    assert {position: tile.description for position, tile in loaded.tiles.items()} == {
+        (0, 0): "a changed", (1, 0): "b"
+    }
+
+    # Within the interval of the last snapshot, but what changed since it isn't known after a load
+    loaded.current_turn_number = 2
+    loaded.save()
+    row = storage.turns.rows[max(storage.turns.rows)]
+    assert row.game_state.snapshot_turn_id is None
+    assert _tiles(row) == {(0, 0): "a changed", (1, 0): "b"}
+
+    loaded.current_turn_number = 3
+    loaded.save()
+    assert storage.turns.rows[max(storage.turns.rows)].game_state.snapshot_turn_id == row.id
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))